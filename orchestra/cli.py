@@ -1,21 +1,153 @@
 """CLI commands for Claude Orchestra."""
 
-import asyncio
+import functools
+import json
 import sys
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 
 import click
-from rich.console import Console
-from rich.live import Live
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
 
-from .config import OrchestraConfig
-from .core import Orchestrator, SessionManager, WorktreeManager
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
-console = Console()
+
+@functools.lru_cache(maxsize=1)
+def _get_console():
+    """Create the shared Rich console on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _json_default(obj):
+    """Serialize datetimes for the stdlib JSON fallback."""
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _emit_json(data) -> None:
+    """Write data to stdout as indented JSON.
+
+    Rich re-parses JSON to highlight it, which only pays off on a terminal;
+    piped output (e.g. ``--json | jq``) is written directly.
+    """
+    if orjson is not None:
+        text = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    else:
+        text = json.dumps(data, indent=2, default=_json_default)
+
+    console = _get_console()
+    if console.is_terminal:
+        console.print_json(text)
+    else:
+        sys.stdout.write(text + "\n")
+
+
+def _trunc(s: Optional[str], n: int, ellipsis: str = "…") -> str:
+    """Shorten s to at most n characters, marking any cut with an ellipsis."""
+    s = s or ""
+    return s if len(s) <= n else s[: n - 1] + ellipsis
+
+
+@dataclass
+class SessionView:
+    """Display fields for a session, derived once and reused across tables."""
+
+    session_id: str
+    project_path: Optional[str]
+    modified_at: datetime
+    message_count: int = 0
+    last_prompt: Optional[str] = None
+
+    @functools.cached_property
+    def id_short(self) -> str:
+        return _trunc(self.session_id, 13)
+
+    @functools.cached_property
+    def project_name(self) -> str:
+        return Path(self.project_path).name if self.project_path else "unknown"
+
+    @functools.cached_property
+    def modified_hms(self) -> str:
+        return self.modified_at.strftime("%H:%M:%S")
+
+    @functools.cached_property
+    def modified_ymd_hm(self) -> str:
+        return self.modified_at.strftime("%Y-%m-%d %H:%M")
+
+    @functools.cached_property
+    def prompt_trunc(self) -> str:
+        return _trunc(self.last_prompt, 40)
+
+    @classmethod
+    def from_session(cls, session) -> "SessionView":
+        """Build a view from a Session object."""
+        return cls(
+            session_id=session.session_id,
+            project_path=session.project_path,
+            modified_at=session.modified_at,
+            message_count=session.message_count,
+            last_prompt=session.last_prompt,
+        )
+
+    @classmethod
+    def from_dict(cls, entry: dict) -> "SessionView":
+        """Build a view from a health or search result entry."""
+        return cls(
+            session_id=entry["session_id"],
+            project_path=entry["project_path"],
+            modified_at=entry["modified_at"],
+            message_count=entry.get("message_count", 0),
+        )
+
+
+def _views_by_id(*entry_lists: List[dict]) -> Dict[str, SessionView]:
+    """Build one SessionView per distinct session across result lists."""
+    views: Dict[str, SessionView] = {}
+    for entries in entry_lists:
+        for entry in entries:
+            if entry["session_id"] not in views:
+                views[entry["session_id"]] = SessionView.from_dict(entry)
+    return views
+
+
+def _session_cache_path() -> Path:
+    """Location of the persistent session metadata cache."""
+    from .config import get_config
+
+    return get_config().session_cache_file
+
+
+@functools.lru_cache(maxsize=8)
+def _find_recent_cached(projects_dir: Path, hours: float, workers: Optional[int]) -> tuple:
+    """Scan for recent sessions once per (projects_dir, hours) in this process."""
+    from .core import SessionManager
+
+    manager = SessionManager(
+        projects_dir=projects_dir, workers=workers, cache_path=_session_cache_path()
+    )
+    return tuple(manager.find_recent(hours=hours))
+
+
+def _find_recent(hours: float, use_cache: bool = True, workers: Optional[int] = None) -> list:
+    """Find recent sessions, reusing earlier parses unless told otherwise."""
+    from .core import SessionManager
+
+    manager = SessionManager(workers=workers)
+    if not use_cache:
+        return manager.find_recent(hours=hours)
+    return list(_find_recent_cached(manager.projects_dir, hours, workers))
+
+
+_workers_option = click.option(
+    "--workers", type=int, default=None, help="Threads for reading session files"
+)
 
 
 @click.group()
@@ -29,7 +161,12 @@ def main():
 @click.option("--force", is_flag=True, help="Overwrite existing config")
 def init(force: bool):
     """Initialize Orchestra in the current project."""
-    config_path = Path.cwd() / ".orchestra" / "config.json"
+    from .config import OrchestraConfig
+
+    console = _get_console()
+
+    cwd = Path.cwd()
+    config_path = cwd / ".orchestra" / "config.json"
 
     if config_path.exists() and not force:
         console.print(
@@ -41,21 +178,19 @@ def init(force: bool):
     config.save(config_path)
 
     # Create worktrees directory
-    worktrees_dir = Path.cwd() / config.worktree_dir
+    worktrees_dir = cwd / config.worktree_dir
     worktrees_dir.mkdir(exist_ok=True)
 
     # Add to .gitignore
-    gitignore = Path.cwd() / ".gitignore"
+    gitignore = cwd / ".gitignore"
     ignore_entries = [config.worktree_dir, ".orchestra/"]
 
-    if gitignore.exists():
-        content = gitignore.read_text()
-        for entry in ignore_entries:
-            if entry not in content:
-                with open(gitignore, "a") as f:
-                    f.write(f"\n{entry}")
-    else:
-        gitignore.write_text("\n".join(ignore_entries) + "\n")
+    content = gitignore.read_text() if gitignore.exists() else ""
+    existing = set(content.splitlines())
+    missing = [entry for entry in ignore_entries if entry not in existing]
+    if missing:
+        head = content.rstrip("\n")
+        gitignore.write_text((head + "\n" if head else "") + "\n".join(missing) + "\n")
 
     console.print("[green]Orchestra initialized successfully![/green]")
     console.print(f"  Config: {config_path}")
@@ -65,25 +200,30 @@ def init(force: bool):
 @main.command()
 @click.option("--hours", default=4.0, help="Hours to look back")
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
-def sessions(hours: float, as_json: bool):
+@click.option(
+    "--no-cache", is_flag=True, help="Re-read session files instead of using cached metadata"
+)
+@_workers_option
+def sessions(hours: float, as_json: bool, no_cache: bool, workers: Optional[int]):
     """List recent Claude Code sessions."""
-    manager = SessionManager()
-    recent = manager.find_recent(hours=hours)
+    from rich.table import Table
 
-    if as_json:
-        import json
+    console = _get_console()
+
+    recent = _find_recent(hours, use_cache=not no_cache, workers=workers)
 
+    if as_json:
         data = [
             {
                 "session_id": s.session_id,
                 "project_path": s.project_path,
-                "modified_at": s.modified_at.isoformat(),
+                "modified_at": s.modified_at,
                 "message_count": s.message_count,
                 "last_prompt": s.last_prompt,
             }
             for s in recent
         ]
-        console.print_json(json.dumps(data))
+        _emit_json(data)
         return
 
     if not recent:
@@ -97,17 +237,13 @@ def sessions(hours: float, as_json: bool):
     table.add_column("Modified", style="green")
     table.add_column("Last Prompt", style="dim", max_width=40)
 
-    for session in recent:
-        project = Path(session.project_path).name if session.project_path else "unknown"
-        modified = session.modified_at.strftime("%H:%M:%S")
-        prompt = (session.last_prompt or "")[:40]
-
+    for view in map(SessionView.from_session, recent):
         table.add_row(
-            session.session_id[:12] + "...",
-            project,
-            str(session.message_count),
-            modified,
-            prompt,
+            view.id_short,
+            view.project_name,
+            str(view.message_count),
+            view.modified_hms,
+            view.prompt_trunc,
         )
 
     console.print(table)
@@ -119,6 +255,12 @@ def sessions(hours: float, as_json: bool):
 @click.option("--no-worktree", is_flag=True, help="Don't use worktrees")
 def spawn(tasks: List[str], parallel: int, no_worktree: bool):
     """Spawn parallel agents for tasks."""
+    from rich.table import Table
+
+    from .core import Orchestrator
+
+    console = _get_console()
+
     if not tasks:
         console.print("[red]No tasks provided[/red]")
         return
@@ -139,28 +281,58 @@ def spawn(tasks: List[str], parallel: int, no_worktree: bool):
 
     for handle in handles:
         worktree = handle.worktree.branch if handle.worktree else "-"
-        table.add_row(handle.agent_id, handle.task[:50], worktree)
+        table.add_row(handle.agent_id, _trunc(handle.task, 50), worktree)
 
     console.print(table)
     console.print("\n[green]Run 'orchestra status' to monitor progress[/green]")
 
 
+_STATUS_STYLES = {
+    "running": "green",
+    "completed": "blue",
+    "failed": "red",
+    "stale": "yellow",
+    "paused": "magenta",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _status_text(agent_status: str):
+    """Styled status cell, built once per distinct status and then shared."""
+    from rich.text import Text
+
+    return Text(agent_status, style=_STATUS_STYLES.get(agent_status, "white"))
+
+
 @main.command()
 @click.option("--watch", "-w", is_flag=True, help="Watch mode with live updates")
 def status(watch: bool):
     """Show agent status."""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from .core import Orchestrator
+
+    console = _get_console()
+
     orchestrator = Orchestrator()
 
-    def render_status():
-        status_data = orchestrator.status()
+    # Rendered cells per agent, reused until that agent's data changes
+    row_cache = {}
 
-        # Summary panel
-        summary = Text()
-        summary.append(f"Running: {status_data['running']} ", style="green")
-        summary.append(f"Completed: {status_data['completed']} ", style="blue")
-        summary.append(f"Failed: {status_data['failed']} ", style="red")
-        summary.append(f"Stale: {status_data['stale']}", style="yellow")
+    def build_row(agent):
+        # last_heartbeat is an ISO timestamp; characters 11-19 are HH:MM:SS
+        heartbeat = agent["last_heartbeat"][11:19] if agent.get("last_heartbeat") else ""
 
+        return (
+            agent["agent_id"][:8],
+            _trunc(agent["task"], 40),
+            _status_text(agent["status"]),
+            _trunc(agent.get("current_activity") or "-", 30),
+            heartbeat,
+        )
+
+    def render_status(status_data):
         # Agents table
         table = Table()
         table.add_column("ID", style="cyan", width=10)
@@ -169,29 +341,24 @@ def status(watch: bool):
         table.add_column("Activity", style="dim", max_width=30)
         table.add_column("Heartbeat", style="dim")
 
+        seen = set()
         for agent in status_data["agents"]:
-            status_style = {
-                "running": "green",
-                "completed": "blue",
-                "failed": "red",
-                "stale": "yellow",
-                "paused": "magenta",
-            }.get(agent["status"], "white")
-
-            heartbeat = ""
-            if agent.get("last_heartbeat"):
-                from datetime import datetime
-
-                hb = datetime.fromisoformat(agent["last_heartbeat"])
-                heartbeat = hb.strftime("%H:%M:%S")
-
-            table.add_row(
-                agent["agent_id"][:8],
-                (agent["task"] or "")[:40],
-                Text(agent["status"], style=status_style),
-                (agent.get("current_activity") or "-")[:30],
-                heartbeat,
+            agent_id = agent["agent_id"]
+            seen.add(agent_id)
+            key = (
+                agent["task"],
+                agent["status"],
+                agent.get("current_activity"),
+                agent.get("last_heartbeat"),
             )
+            cached = row_cache.get(agent_id)
+            if cached is None or cached[0] != key:
+                cached = row_cache[agent_id] = (key, build_row(agent))
+            table.add_row(*cached[1])
+
+        # Forget agents that have been cleaned up
+        for agent_id in row_cache.keys() - seen:
+            del row_cache[agent_id]
 
         return Panel.fit(
             table,
@@ -200,33 +367,57 @@ def status(watch: bool):
         )
 
     if watch:
-        with Live(render_status(), refresh_per_second=1, console=console) as live:
+        import time
+
+        from rich.live import Live
+
+        # Live redraws on its own; we poll the state file's mtime and only
+        # rebuild the renderable once it changed, at most twice a second.
+        # A periodic refresh still lets agents age into "stale".
+        last_signature = None
+        last_refresh = float("-inf")
+        dirty = True
+        with Live(console=console, refresh_per_second=2, auto_refresh=True) as live:
             try:
                 while True:
-                    live.update(render_status())
-                    import time
-
-                    time.sleep(1)
+                    dirty = orchestrator.state.reload_if_changed() or dirty
+                    now = time.monotonic()
+                    if (dirty and now - last_refresh >= 0.5) or now - last_refresh >= 5:
+                        status_data = orchestrator.status()
+                        signature = hash(repr(status_data))
+                        if signature != last_signature:
+                            live.update(render_status(status_data))
+                            last_signature = signature
+                        last_refresh = now
+                        dirty = False
+                    time.sleep(0.25)
             except KeyboardInterrupt:
                 pass
     else:
-        console.print(render_status())
+        console.print(render_status(orchestrator.status()))
 
 
 @main.command()
 @click.option("--wait", "-w", is_flag=True, help="Wait for all agents to complete")
 def collect(wait: bool):
-    """Collect results from agents."""
-    orchestrator = Orchestrator()
+    """Collect results from agents.
+
+    Agents are awaited concurrently, so the wait is bounded by the slowest
+    agent rather than the sum of all of them.
+    """
+    from rich.table import Table
+    from rich.text import Text
 
-    async def do_collect():
-        results = await orchestrator.collect()
-        return results
+    from .core import Orchestrator
+
+    console = _get_console()
+
+    orchestrator = Orchestrator()
 
     if wait:
         console.print("[bold]Waiting for agents to complete...[/bold]")
 
-    results = asyncio.run(do_collect())
+    results = orchestrator.collect_sync()
 
     if not results:
         console.print("[yellow]No agents to collect from[/yellow]")
@@ -244,7 +435,7 @@ def collect(wait: bool):
 
         table.add_row(
             agent_id[:8],
-            result.task[:40],
+            _trunc(result.task, 40),
             Text(status_text, style=status_style),
             f"{result.duration_seconds:.1f}s",
         )
@@ -256,6 +447,10 @@ def collect(wait: bool):
 @click.option("--all", "cleanup_all", is_flag=True, help="Clean up all agents, not just completed")
 def cleanup(cleanup_all: bool):
     """Clean up completed agents and worktrees."""
+    from .core import Orchestrator
+
+    console = _get_console()
+
     orchestrator = Orchestrator()
     cleaned = orchestrator.cleanup(completed_only=not cleanup_all)
 
@@ -265,6 +460,12 @@ def cleanup(cleanup_all: bool):
 @main.command()
 def worktrees():
     """List active worktrees."""
+    from rich.table import Table
+
+    from .core import WorktreeManager
+
+    console = _get_console()
+
     manager = WorktreeManager()
     active = manager.list_active()
 
@@ -286,35 +487,39 @@ def worktrees():
 @main.command()
 @click.option("--hours", default=24.0, help="Hours to look back (default 24)")
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
-def analytics(hours: float, as_json: bool):
+@click.option(
+    "--no-cache", is_flag=True, help="Re-read session files instead of using cached metadata"
+)
+@_workers_option
+def analytics(hours: float, as_json: bool, no_cache: bool, workers: Optional[int]):
     """Show session analytics and insights."""
     from collections import defaultdict
 
-    manager = SessionManager()
-    sessions = manager.find_recent(hours=hours)
+    from rich import box
+    from rich.console import Group
+    from rich.table import Table
 
-    # Calculate analytics
-    total_sessions = len(sessions)
-    total_messages = sum(s.message_count for s in sessions)
-    avg_messages = total_messages / total_sessions if total_sessions > 0 else 0
+    console = _get_console()
+
+    sessions = _find_recent(hours, use_cache=not no_cache, workers=workers)
 
-    # Group sessions by project
+    # Group sessions by project, tracking totals in the same pass
     projects = defaultdict(list)
-    for session in sessions:
-        project_name = Path(session.project_path).name if session.project_path else "unknown"
-        projects[project_name].append(session)
-
-    # Find most active project
-    most_active_project = None
-    most_active_count = 0
-    for project_name, project_sessions in projects.items():
-        if len(project_sessions) > most_active_count:
-            most_active_count = len(project_sessions)
-            most_active_project = project_name
+    project_messages = defaultdict(int)
+    total_messages = 0
+    for view in map(SessionView.from_session, sessions):
+        projects[view.project_name].append(view)
+        project_messages[view.project_name] += view.message_count
+        total_messages += view.message_count
 
-    if as_json:
-        import json
+    # Ties go to the project seen first, so pick only once grouping is done
+    most_active_project = max(projects, key=lambda name: len(projects[name]), default=None)
+    most_active_count = len(projects[most_active_project]) if most_active_project else 0
 
+    total_sessions = len(sessions)
+    avg_messages = total_messages / total_sessions if total_sessions > 0 else 0
+
+    if as_json:
         data = {
             "period_hours": hours,
             "total_sessions": total_sessions,
@@ -327,12 +532,12 @@ def analytics(hours: float, as_json: bool):
             "projects": {
                 name: {
                     "session_count": len(sess_list),
-                    "total_messages": sum(s.message_count for s in sess_list),
+                    "total_messages": project_messages[name],
                     "sessions": [
                         {
                             "session_id": s.session_id,
                             "message_count": s.message_count,
-                            "modified_at": s.modified_at.isoformat(),
+                            "modified_at": s.modified_at,
                         }
                         for s in sess_list
                     ],
@@ -340,7 +545,7 @@ def analytics(hours: float, as_json: bool):
                 for name, sess_list in projects.items()
             },
         }
-        console.print_json(json.dumps(data))
+        _emit_json(data)
         return
 
     if not sessions:
@@ -358,11 +563,8 @@ def analytics(hours: float, as_json: bool):
     if most_active_project:
         summary_table.add_row("Most Active Project", f"{most_active_project} ({most_active_count} sessions)")
 
-    console.print(summary_table)
-    console.print()
-
     # Projects breakdown table
-    projects_table = Table(title="Sessions by Project")
+    projects_table = Table(title="Sessions by Project", box=box.SIMPLE)
     projects_table.add_column("Project", style="blue")
     projects_table.add_column("Sessions", justify="right")
     projects_table.add_column("Messages", justify="right")
@@ -373,7 +575,7 @@ def analytics(hours: float, as_json: bool):
 
     for project_name, project_sessions in sorted_projects:
         session_count = len(project_sessions)
-        message_count = sum(s.message_count for s in project_sessions)
+        message_count = project_messages[project_name]
         avg_msgs = message_count / session_count if session_count > 0 else 0
 
         projects_table.add_row(
@@ -383,25 +585,30 @@ def analytics(hours: float, as_json: bool):
             f"{avg_msgs:.1f}",
         )
 
-    console.print(projects_table)
+    console.print(Group(summary_table, "", projects_table))
+
+
+# (divisor, format) per 1024x step, indexed by (bit_length - 1) // 10
+_BYTE_UNITS = (
+    (1, "{:.0f} B"),
+    (1024, "{:.1f} KB"),
+    (1024**2, "{:.1f} MB"),
+    (1024**3, "{:.2f} GB"),
+)
 
 
 def _format_bytes(size_bytes: int) -> str:
     """Format bytes as human-readable string."""
-    if size_bytes < 1024:
-        return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
+    index = min(max(size_bytes.bit_length() - 1, 0) // 10, len(_BYTE_UNITS) - 1)
+    divisor, fmt = _BYTE_UNITS[index]
+    return fmt.format(size_bytes / divisor)
 
 
 @main.command()
 @click.option("--hours", default=168.0, help="Hours to look back (default: 168 = 1 week)")
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
-def health(hours: float, as_json: bool):
+@_workers_option
+def health(hours: float, as_json: bool, workers: Optional[int]):
     """Check health of Claude sessions and storage.
 
     Shows storage usage, active vs stale sessions, and identifies
@@ -415,18 +622,18 @@ def health(hours: float, as_json: bool):
 
         orchestra health --json
     """
-    manager = SessionManager()
-    report = manager.check_health(hours=hours)
+    from rich import box
+    from rich.console import Group
+    from rich.table import Table
 
-    if as_json:
-        import json
+    from .core import SessionManager
+
+    console = _get_console()
 
-        # Convert datetimes to ISO format for JSON
-        def serialize(obj):
-            if hasattr(obj, "isoformat"):
-                return obj.isoformat()
-            return obj
+    manager = SessionManager(workers=workers, cache_path=_session_cache_path())
+    report = manager.check_health(hours=hours)
 
+    if as_json:
         json_report = {
             "storage_bytes": report["storage_bytes"],
             "storage_human": _format_bytes(report["storage_bytes"]),
@@ -435,48 +642,12 @@ def health(hours: float, as_json: bool):
             "stale_session_count": len(report["stale_sessions"]),
             "orphaned_session_count": len(report["orphaned_sessions"]),
             "large_session_count": len(report["largest_sessions"]),
-            "stale_sessions": [
-                {
-                    "session_id": s["session_id"],
-                    "project_path": s["project_path"],
-                    "modified_at": serialize(s["modified_at"]),
-                    "message_count": s["message_count"],
-                    "file_size": s["file_size"],
-                }
-                for s in report["stale_sessions"]
-            ],
-            "orphaned_sessions": [
-                {
-                    "session_id": s["session_id"],
-                    "project_path": s["project_path"],
-                    "modified_at": serialize(s["modified_at"]),
-                    "message_count": s["message_count"],
-                    "file_size": s["file_size"],
-                }
-                for s in report["orphaned_sessions"]
-            ],
-            "largest_sessions": [
-                {
-                    "session_id": s["session_id"],
-                    "project_path": s["project_path"],
-                    "modified_at": serialize(s["modified_at"]),
-                    "message_count": s["message_count"],
-                    "file_size": s["file_size"],
-                }
-                for s in report["largest_sessions"]
-            ],
-            "oldest_sessions": [
-                {
-                    "session_id": s["session_id"],
-                    "project_path": s["project_path"],
-                    "modified_at": serialize(s["modified_at"]),
-                    "message_count": s["message_count"],
-                    "file_size": s["file_size"],
-                }
-                for s in report["oldest_sessions"]
-            ],
+            "stale_sessions": report["stale_sessions"],
+            "orphaned_sessions": report["orphaned_sessions"],
+            "largest_sessions": report["largest_sessions"],
+            "oldest_sessions": report["oldest_sessions"],
         }
-        console.print_json(json.dumps(json_report))
+        _emit_json(json_report)
         return
 
     # Summary section
@@ -492,12 +663,14 @@ def health(hours: float, as_json: bool):
     summary_table.add_row("Orphaned Sessions", str(len(report["orphaned_sessions"])))
     summary_table.add_row("Large Sessions (>1000 msgs)", str(len(report["largest_sessions"])))
 
-    console.print(summary_table)
+    renderables = [summary_table]
+    views = _views_by_id(
+        report["largest_sessions"], report["orphaned_sessions"], report["oldest_sessions"]
+    )
 
     # Large sessions warning
     if report["largest_sessions"]:
-        console.print()
-        large_table = Table(title="Large Sessions (>1000 messages)")
+        large_table = Table(title="Large Sessions (>1000 messages)", box=box.SIMPLE)
         large_table.add_column("Session ID", style="cyan")
         large_table.add_column("Project", style="blue")
         large_table.add_column("Messages", justify="right", style="yellow")
@@ -505,22 +678,20 @@ def health(hours: float, as_json: bool):
         large_table.add_column("Modified", style="dim")
 
         for s in report["largest_sessions"]:
-            project = Path(s["project_path"]).name if s["project_path"] else "unknown"
-            modified = s["modified_at"].strftime("%Y-%m-%d %H:%M")
+            view = views[s["session_id"]]
             large_table.add_row(
-                s["session_id"][:12] + "...",
-                project,
+                view.id_short,
+                view.project_name,
                 str(s["message_count"]),
                 _format_bytes(s["file_size"]),
-                modified,
+                view.modified_ymd_hm,
             )
 
-        console.print(large_table)
+        renderables += ["", large_table]
 
     # Orphaned sessions
     if report["orphaned_sessions"]:
-        console.print()
-        orphan_table = Table(title="Orphaned Sessions (project no longer exists)")
+        orphan_table = Table(title="Orphaned Sessions (project no longer exists)", box=box.SIMPLE)
         orphan_table.add_column("Session ID", style="cyan")
         orphan_table.add_column("Original Project", style="red")
         orphan_table.add_column("Messages", justify="right")
@@ -528,18 +699,17 @@ def health(hours: float, as_json: bool):
 
         for s in report["orphaned_sessions"]:
             orphan_table.add_row(
-                s["session_id"][:12] + "...",
+                views[s["session_id"]].id_short,
                 s["project_path"] or "unknown",
                 str(s["message_count"]),
                 _format_bytes(s["file_size"]),
             )
 
-        console.print(orphan_table)
+        renderables += ["", orphan_table]
 
     # Oldest sessions that could be cleaned up
     if report["oldest_sessions"]:
-        console.print()
-        oldest_table = Table(title="Oldest Sessions (cleanup candidates)")
+        oldest_table = Table(title="Oldest Sessions (cleanup candidates)", box=box.SIMPLE)
         oldest_table.add_column("Session ID", style="cyan")
         oldest_table.add_column("Project", style="blue")
         oldest_table.add_column("Messages", justify="right")
@@ -547,29 +717,34 @@ def health(hours: float, as_json: bool):
         oldest_table.add_column("Modified", style="dim")
 
         for s in report["oldest_sessions"]:
-            project = Path(s["project_path"]).name if s["project_path"] else "unknown"
-            modified = s["modified_at"].strftime("%Y-%m-%d %H:%M")
+            view = views[s["session_id"]]
             oldest_table.add_row(
-                s["session_id"][:12] + "...",
-                project,
+                view.id_short,
+                view.project_name,
                 str(s["message_count"]),
                 _format_bytes(s["file_size"]),
-                modified,
+                view.modified_ymd_hm,
             )
 
-        console.print(oldest_table)
+        renderables += ["", oldest_table]
 
     # Summary tips
     if stale_count > 0 or report["orphaned_sessions"]:
-        console.print()
-        console.print("[dim]Tip: Stale and orphaned sessions can be safely deleted from ~/.claude/projects/[/dim]")
+        renderables += [
+            "",
+            "[dim]Tip: Stale and orphaned sessions can be safely deleted from ~/.claude/projects/[/dim]",
+        ]
+
+    console.print(Group(*renderables))
 
 
 @main.command()
 @click.argument("query")
 @click.option("--hours", default=168, help="Hours to look back (default: 168 = 1 week)")
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
-def search(query: str, hours: int, as_json: bool):
+@click.option("--case-sensitive", is_flag=True, help="Match the query's case exactly")
+@_workers_option
+def search(query: str, hours: int, as_json: bool, case_sensitive: bool, workers: Optional[int]):
     """Search sessions for matching prompts.
 
     Find sessions where user prompts contain the search term.
@@ -583,23 +758,28 @@ def search(query: str, hours: int, as_json: bool):
 
         orchestra search "refactor" --json
     """
-    manager = SessionManager()
-    results = manager.search(query=query, hours=float(hours))
+    from rich.console import Group
+    from rich.table import Table
 
-    if as_json:
-        import json
+    from .core import SessionManager
 
+    console = _get_console()
+
+    manager = SessionManager(workers=workers)
+    results = manager.search(query=query, hours=float(hours), case_sensitive=case_sensitive)
+
+    if as_json:
         data = [
             {
                 "session_id": r["session_id"],
                 "project_path": r["project_path"],
-                "modified_at": r["modified_at"].isoformat(),
+                "modified_at": r["modified_at"],
                 "match_count": r["match_count"],
                 "sample_prompt": r["sample_prompt"],
             }
             for r in results
         ]
-        console.print_json(json.dumps(data))
+        _emit_json(data)
         return
 
     if not results:
@@ -616,24 +796,24 @@ def search(query: str, hours: int, as_json: bool):
     table.add_column("Sample Prompt", style="white", max_width=50)
 
     for result in results:
-        project = Path(result["project_path"]).name if result["project_path"] else "unknown"
-        modified = result["modified_at"].strftime("%Y-%m-%d %H:%M")
-        sample = (result["sample_prompt"] or "")[:50]
-        if len(result["sample_prompt"] or "") > 50:
-            sample += "..."
+        view = SessionView.from_dict(result)
+        sample = _trunc(result["sample_prompt"], 50)
 
         table.add_row(
-            result["session_id"][:12] + "...",
-            project,
+            view.id_short,
+            view.project_name,
             str(result["match_count"]),
-            modified,
+            view.modified_ymd_hm,
             sample,
         )
 
-    console.print(table)
     console.print(
-        f"\n[dim]Found {len(results)} session(s). "
-        f"Use 'claude --resume <session_id>' to continue a session.[/dim]"
+        Group(
+            table,
+            "",
+            f"[dim]Found {len(results)} session(s). "
+            f"Use 'claude --resume <session_id>' to continue a session.[/dim]",
+        )
     )
 
 
@@ -642,6 +822,8 @@ def search(query: str, hours: int, as_json: bool):
 @click.option("--host", "-h", default="0.0.0.0", help="Host to bind to")
 def web(port: int, host: str):
     """Launch web dashboard."""
+    console = _get_console()
+
     console.print(f"[bold]Starting web dashboard at http://{host}:{port}[/bold]")
     console.print("[dim]Press Ctrl+C to stop[/dim]")
 
@@ -673,7 +855,11 @@ def export(session_id: str, last: bool, output: str):
 
         orchestra export abc123def > session.md
     """
-    manager = SessionManager()
+    from .core import SessionManager
+
+    console = _get_console()
+
+    manager = SessionManager(cache_path=_session_cache_path())
 
     # Determine which session to export
     if last:
@@ -690,20 +876,22 @@ def export(session_id: str, last: bool, output: str):
         sys.exit(1)
 
     # Export to markdown
-    markdown = manager.export_to_markdown(target_id)
+    chunks = manager.iter_markdown(target_id)
 
-    if not markdown:
+    if chunks is None:
         console.print(f"[red]Session not found: {target_id}[/red]")
         sys.exit(1)
 
     # Output
     if output:
         output_path = Path(output)
-        output_path.write_text(markdown)
+        with open(output_path, "w") as f:
+            f.writelines(chunks)
         console.print(f"[green]Exported to {output_path}[/green]")
     else:
         # Write to stdout (bypass rich console for clean output)
-        print(markdown)
+        for chunk in chunks:
+            sys.stdout.write(chunk)
 
 
 if __name__ == "__main__":
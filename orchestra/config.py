@@ -1,11 +1,22 @@
 """Configuration management for Claude Orchestra."""
 
+import functools
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional
 
 
+@functools.lru_cache(maxsize=8)
+def _load_cached(path_str: str, mtime_ns: int) -> dict:
+    """Parse a config file once per (path, mtime) and reuse the result.
+
+    Callers must copy mutable values out of the returned dict.
+    """
+    with open(path_str) as f:
+        return json.load(f)
+
+
 @dataclass
 class OrchestraConfig:
     """Configuration for Claude Orchestra."""
@@ -47,6 +58,9 @@ class OrchestraConfig:
     state_file: Path = field(
         default_factory=lambda: Path.home() / ".config" / "claude-orchestra" / "state.json"
     )
+    session_cache_file: Path = field(
+        default_factory=lambda: Path.home() / ".cache" / "claude-orchestra" / "sessions.json"
+    )
 
     @classmethod
     def load(cls, config_path: Optional[Path] = None) -> "OrchestraConfig":
@@ -54,16 +68,19 @@ class OrchestraConfig:
         if config_path is None:
             config_path = Path.home() / ".config" / "claude-orchestra" / "config.json"
 
-        if config_path.exists():
-            with open(config_path) as f:
-                data = json.load(f)
-            return cls(
-                **{
-                    k: Path(v) if k.endswith("_dir") or k == "state_file" else v
-                    for k, v in data.items()
-                }
-            )
-        return cls()
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return cls()
+
+        kwargs = {}
+        for k, v in _load_cached(str(config_path), mtime_ns).items():
+            if k.endswith(("_dir", "_file")):
+                v = Path(v)
+            elif isinstance(v, list):
+                v = list(v)  # the cached dict is shared between loads
+            kwargs[k] = v
+        return cls(**kwargs)
 
     def save(self, config_path: Optional[Path] = None) -> None:
         """Save config to file."""
@@ -84,6 +101,7 @@ class OrchestraConfig:
             "dashboard_host": self.dashboard_host,
             "dashboard_port": self.dashboard_port,
             "state_file": str(self.state_file),
+            "session_cache_file": str(self.session_cache_file),
         }
 
         with open(config_path, "w") as f:
@@ -106,3 +124,4 @@ def set_config(config: OrchestraConfig) -> None:
     """Set the global config instance."""
     global _config
     _config = config
+    _load_cached.cache_clear()
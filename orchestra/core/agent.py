@@ -2,7 +2,9 @@
 
 import asyncio
 import subprocess
+import sys
 import uuid
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -13,6 +15,51 @@ from .session import SessionManager
 from .state import AgentState, StateManager
 from .worktree import Worktree, WorktreeManager
 
+# Agents can log far more than anyone reads back; keep only the end
+_OUTPUT_TAIL_BYTES = 64 * 1024
+
+
+def _decode_tail(data: bytes, limit: int = _OUTPUT_TAIL_BYTES) -> str:
+    """Decode the last limit bytes of output, starting on a UTF-8 boundary."""
+    tail = data[-limit:]
+    if len(data) > limit:
+        # Skip continuation bytes of a character cut off by the slice
+        start = 0
+        while start < min(len(tail), 3) and tail[start] & 0xC0 == 0x80:
+            start += 1
+        tail = tail[start:]
+    return tail.decode("utf-8", errors="replace")
+
+
+async def _read_pipe(pipe, limit: int = _OUTPUT_TAIL_BYTES) -> str:
+    """Read a subprocess pipe to EOF on the running event loop.
+
+    Only the last limit bytes are retained, so memory stays bounded no
+    matter how much the agent writes.
+
+    Args:
+        pipe: A Popen stdout/stderr file object, or None.
+        limit: Number of trailing bytes to keep.
+
+    Returns:
+        The tail of the pipe's output, decoded as UTF-8.
+    """
+    if pipe is None:
+        return ""
+    reader = asyncio.StreamReader()
+    transport, _ = await asyncio.get_running_loop().connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), pipe
+    )
+    buffer = bytearray()
+    try:
+        while chunk := await reader.read(65536):
+            buffer += chunk
+            if len(buffer) > 2 * limit:
+                del buffer[:-limit]
+    finally:
+        transport.close()
+    return _decode_tail(bytes(buffer), limit)
+
 
 @dataclass
 class AgentHandle:
@@ -60,6 +107,10 @@ class Orchestrator:
         self.sessions = session_manager or SessionManager()
         self.config = get_config()
         self._handles: Dict[str, AgentHandle] = {}
+        # Allowlist flags are the same for every agent this instance spawns
+        self._bypass_argv = tuple(
+            arg for pattern in self.config.bypass_permissions for arg in ("--allowedTools", pattern)
+        )
 
     def spawn(
         self,
@@ -106,20 +157,17 @@ class Orchestrator:
             worktree = self.worktrees.create(task)
             cwd = worktree.path
 
-        # Build command with bypass permissions
-        cmd = ["claude", "--print", task, "--dangerously-skip-permissions"]
+        # Build command with bypass permissions and the allowlist for common operations
+        cmd = ["claude", "--print", task, "--dangerously-skip-permissions", *self._bypass_argv]
 
-        # Add allowlist for common operations
-        for pattern in self.config.bypass_permissions:
-            cmd.extend(["--allowedTools", pattern])
-
-        # Start the process
+        # Start the process. collect() drains the pipes as raw bytes, so they
+        # need no Python-side buffering or text decoding.
         process = subprocess.Popen(
             cmd,
             cwd=cwd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
+            bufsize=0,
         )
 
         # Track state
@@ -153,13 +201,27 @@ class Orchestrator:
         if handles is None:
             handles = list(self._handles.values())
 
-        results = {}
+        # Wait on all agents at once so total time tracks the slowest agent
+        results = await asyncio.gather(*(self._collect_single(h) for h in handles))
+        if results:
+            # _collect_single only updates state in memory; persist it once
+            self.state.save()
 
         for handle in handles:
-            result = await self._collect_single(handle)
-            results[handle.agent_id] = result
+            self._handles.pop(handle.agent_id, None)
 
-        return results
+        return {result.agent_id: result for result in results}
+
+    def collect_sync(self, handles: Optional[List[AgentHandle]] = None) -> Dict[str, AgentResult]:
+        """Collect results from agents without an existing event loop.
+
+        Args:
+            handles: List of handles to collect from. Defaults to all running.
+
+        Returns:
+            Dictionary of agent_id to AgentResult.
+        """
+        return asyncio.run(self.collect(handles))
 
     async def _collect_single(self, handle: AgentHandle) -> AgentResult:
         """Collect result from a single agent.
@@ -173,9 +235,18 @@ class Orchestrator:
         start_time = datetime.now()
 
         # Wait for process to complete
-        stdout, stderr = await asyncio.get_event_loop().run_in_executor(
-            None, handle.process.communicate
-        )
+        process = handle.process
+        if sys.platform == "win32":
+            # Popen pipes are not overlapped, so the proactor loop cannot read them
+            out, err = await asyncio.get_running_loop().run_in_executor(None, process.communicate)
+            stdout, stderr = _decode_tail(out or b""), _decode_tail(err or b"")
+        else:
+            # Drain both pipes on the loop itself; no worker thread per agent
+            stdout, stderr = await asyncio.gather(
+                _read_pipe(process.stdout), _read_pipe(process.stderr)
+            )
+            while process.poll() is None:
+                await asyncio.sleep(0.05)
 
         duration = (datetime.now() - start_time).total_seconds()
         success = handle.process.returncode == 0
@@ -184,13 +255,8 @@ class Orchestrator:
         agent_state = self.state.get_agent(handle.agent_id)
         if agent_state:
             agent_state.status = "completed" if success else "failed"
-            agent_state.result = stdout[:1000] if stdout else None
+            agent_state.result = stdout[-1000:] if stdout else None
             agent_state.error_message = stderr if not success else None
-            self.state.save()
-
-        # Clean up handle
-        if handle.agent_id in self._handles:
-            del self._handles[handle.agent_id]
 
         return AgentResult(
             agent_id=handle.agent_id,
@@ -211,13 +277,14 @@ class Orchestrator:
         self.state.mark_stale_agents(self.config.stale_threshold)
 
         agents = self.state.list_agents()
+        counts = Counter(a.status for a in agents)
 
         return {
             "total": len(agents),
-            "running": len([a for a in agents if a.status == "running"]),
-            "completed": len([a for a in agents if a.status == "completed"]),
-            "failed": len([a for a in agents if a.status == "failed"]),
-            "stale": len([a for a in agents if a.status == "stale"]),
+            "running": counts["running"],
+            "completed": counts["completed"],
+            "failed": counts["failed"],
+            "stale": counts["stale"],
             "agents": [a.to_dict() for a in agents],
         }
 
@@ -277,7 +344,7 @@ class Orchestrator:
         Returns:
             Number of agents cleaned up.
         """
-        cleaned = 0
+        removed = []
         agents = self.state.list_agents()
 
         for agent in agents:
@@ -288,9 +355,9 @@ class Orchestrator:
                 if agent.worktree_path:
                     worktree = self.worktrees.get_worktree(agent.task)
                     if worktree:
-                        self.worktrees.remove(worktree)
+                        self.worktrees.remove(worktree, force=True)
 
-                self.state.remove_agent(agent.agent_id)
-                cleaned += 1
+                removed.append(agent.agent_id)
 
-        return cleaned
+        self.state.remove_agents(removed)
+        return len(removed)
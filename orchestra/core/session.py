@@ -1,14 +1,146 @@
 """Session discovery and management for Claude Code sessions."""
 
+import heapq
 import json
+import mmap
+import os
+import re
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 
 from ..config import get_config
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+    _loads = json.loads
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _dumps_indented(value: Any) -> str:
+    """Pretty-print a JSON value for markdown export, via orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits
+    return json.dumps(value, indent=2, ensure_ascii=False)
+
+
+# Smallest batch of session files worth handing to a thread pool
+_MIN_PARALLEL_ITEMS = 8
+
+# Bump when the cached metadata fields or how they are parsed change
+_CACHE_VERSION = 1
+
+
+def _raw_needle(query: str) -> Optional[bytes]:
+    """Return the bytes a matching prompt must contain in the raw JSONL.
+
+    Only plain printable ASCII survives JSON encoding byte-for-byte; other
+    queries (quotes, backslashes, non-ASCII) may be escaped on disk, so they
+    get no prefilter.
+    """
+    if query and query.isascii() and query.isprintable() and not any(c in query for c in '"\\'):
+        return query.encode("ascii")
+    return None
+
+
+def _prompt_from_message(msg: Dict[str, Any]) -> Optional[str]:
+    """Return the prompt text a user message contributes, if any."""
+    content = msg.get("content", "")
+    if isinstance(content, str):
+        return content[:100]
+    if isinstance(content, list):
+        # Handle content blocks
+        for block in content:
+            if isinstance(block, dict) and block.get("type") == "text":
+                return block.get("text", "")[:100]
+    return None
+
+
+# Session files up to this size are read in one call and split; larger
+# ones are streamed line by line to bound memory
+_SLURP_LIMIT = 100 * 1024 * 1024
+
+
+def _iter_lines(session_path: Path) -> Iterator[bytes]:
+    """Yield the raw lines of a session file."""
+    if session_path.stat().st_size <= _SLURP_LIMIT:
+        yield from session_path.read_bytes().split(b"\n")
+    else:
+        with open(session_path, "rb") as f:
+            yield from f
+
+
+# A top-level key/value as written by compact and by json.dumps-style encoders
+_INIT_MARKERS = (b'"type":"init"', b'"type": "init"')
+_USER_MARKERS = (b'"role":"user"', b'"role": "user"')
+_SCAN_MARKERS = _INIT_MARKERS + _USER_MARKERS
+
+
+def _last_message(
+    data, markers: Tuple[bytes, ...], accept: Callable[[dict], bool]
+) -> Optional[dict]:
+    """Find the last JSONL line containing a marker whose message passes accept.
+
+    Only candidate lines are decoded, walking backwards from the end of data.
+    """
+    end = len(data)
+    while True:
+        idx = max(data.rfind(marker, 0, end) for marker in markers)
+        if idx == -1:
+            return None
+        start = data.rfind(b"\n", 0, idx) + 1
+        stop = data.find(b"\n", idx)
+        try:
+            msg = _loads(data[start : stop if stop != -1 else len(data)])
+        except ValueError:
+            msg = None
+        if isinstance(msg, dict) and accept(msg):
+            return msg
+        end = start
+
+
+def _missing_paths(paths: List[str]) -> set:
+    """Return the paths that no longer exist, listing each parent directory once.
+
+    Sessions from the same machine share a handful of parent directories, so
+    one scandir per parent replaces a stat per session. A name missing from
+    the listing is confirmed with a stat, since the listing never holds
+    ``.`` or ``..`` and may differ in case on case-insensitive filesystems.
+    """
+    by_parent: Dict[str, List[Tuple[str, str]]] = {}
+    for path in set(paths):
+        parent, name = os.path.split(path.rstrip(os.sep))
+        by_parent.setdefault(parent, []).append((path, name))
+
+    missing = set()
+    for parent, entries in by_parent.items():
+        try:
+            with os.scandir(parent or ".") as it:
+                names = {entry.name for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            missing.update(path for path, _ in entries)
+            continue
+        except OSError:
+            names = set()
+
+        for path, name in entries:
+            if name not in names and not os.path.exists(path):
+                missing.add(path)
+    return missing
+
 
 @dataclass
 class Session:
@@ -27,14 +159,66 @@ class Session:
 class SessionManager:
     """Manages Claude Code session discovery and operations."""
 
-    def __init__(self, projects_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        projects_dir: Optional[Path] = None,
+        workers: Optional[int] = None,
+        cache_path: Optional[Path] = None,
+    ):
         """Initialize session manager.
 
         Args:
             projects_dir: Path to Claude projects directory.
                          Defaults to ~/.claude/projects/
+            workers: Threads used to read session files in parallel.
+                     Defaults to min(32, cpu_count * 4); 1 reads serially.
+            cache_path: JSON file persisting parsed session metadata for this
+                        projects_dir between runs, keyed by file mtime and
+                        size. None disables it.
         """
         self.projects_dir = projects_dir or get_config().claude_projects_dir
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 4)
+        self.cache_path = cache_path
+        self._cache: Optional[Dict[str, list]] = None
+        self._cache_dirty = False
+        # session_id -> project directory, filled by every scan so lookups by
+        # ID can skip walking all projects
+        self._session_dirs: Dict[str, str] = {}
+
+    def _map(self, func: Callable[[T], R], items: List[T]) -> List[R]:
+        """Apply func to items, fanning out over a thread pool when worthwhile.
+
+        Session scans are dominated by file reads, which release the GIL.
+        Below _MIN_PARALLEL_ITEMS files, thread startup costs more than the
+        overlap saves. Results are returned in input order.
+        """
+        if self.workers <= 1 or len(items) < _MIN_PARALLEL_ITEMS:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(items))) as pool:
+            return list(pool.map(func, items))
+
+    def _iter_session_files(self) -> Iterator[Tuple[str, str, os.stat_result]]:
+        """Yield (path, project_hash, stat) for every session JSONL file.
+
+        A single os.scandir walk replaces iterdir, glob and Path.stat, and
+        Path objects are left to the caller for the files it keeps.
+        """
+        session_dirs = self._session_dirs
+        with os.scandir(self.projects_dir) as project_dirs:
+            for project_dir in project_dirs:
+                if not project_dir.is_dir():
+                    continue
+
+                with os.scandir(project_dir.path) as entries:
+                    for entry in entries:
+                        if not entry.name.endswith(".jsonl"):
+                            continue
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        session_dirs[entry.name[:-6]] = project_dir.path
+                        yield entry.path, project_dir.name, stat
 
     def find_recent(self, hours: float = 2.0) -> List[Session]:
         """Find sessions modified within the last N hours.
@@ -48,33 +232,133 @@ class SessionManager:
         if not self.projects_dir.exists():
             return []
 
-        cutoff = datetime.now() - timedelta(hours=hours)
-        sessions = []
+        cutoff_ts = time.time() - hours * 3600
+        candidates = []
+        seen = set()
 
-        # Scan all project directories
-        for project_dir in self.projects_dir.iterdir():
-            if not project_dir.is_dir():
+        for session_file, project_hash, stat in self._iter_session_files():
+            seen.add(session_file)
+            if stat.st_mtime < cutoff_ts:
                 continue
 
-            project_hash = project_dir.name
-
-            # Find all JSONL session files
-            for session_file in project_dir.glob("*.jsonl"):
-                stat = session_file.stat()
-                modified_at = datetime.fromtimestamp(stat.st_mtime)
-
-                if modified_at < cutoff:
-                    continue
+            modified_at = datetime.fromtimestamp(stat.st_mtime)
+            candidates.append((Path(session_file), project_hash, modified_at, stat))
 
-                # Parse session metadata
-                session = self._parse_session(session_file, project_hash, modified_at)
-                if session:
-                    sessions.append(session)
+        # Parse session metadata
+        parsed = self._load_sessions(candidates, seen)
+        sessions = [session for session in parsed if session]
 
         # Sort by modification time (newest first)
         sessions.sort(key=lambda s: s.modified_at, reverse=True)
         return sessions
 
+    def _load_sessions(self, candidates: List[tuple], seen: set) -> List[Optional[Session]]:
+        """Load metadata for scanned session files, then persist the cache.
+
+        Args:
+            candidates: (session_path, project_hash, modified_at, stat) tuples.
+            seen: Every session file path found by the scan, used to drop
+                  cache entries for deleted files.
+
+        Returns:
+            A Session or None for each candidate, in order.
+        """
+        cache = self._metadata_cache() if self.cache_path is not None else {}
+        sessions = [self._cached_session(cache, *c) for c in candidates]
+
+        # Only files without a usable cache entry are worth a pool thread
+        misses = [i for i, session in enumerate(sessions) if session is None]
+        parsed = self._map(lambda i: self._parse_session(*candidates[i][:3]), misses)
+        for i, session in zip(misses, parsed):
+            sessions[i] = session
+            if session and self.cache_path is not None:
+                stat = candidates[i][3]
+                cache[str(session.session_path)] = [
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    session.message_count,
+                    session.project_path,
+                    session.last_prompt,
+                ]
+                self._cache_dirty = True
+
+        self._save_cache(seen)
+        return sessions
+
+    def _cached_session(
+        self,
+        cache: Dict[str, list],
+        session_path: Path,
+        project_hash: str,
+        modified_at: datetime,
+        stat: os.stat_result,
+    ) -> Optional[Session]:
+        """Build a Session from cached metadata if the file is unchanged."""
+        entry = cache.get(str(session_path))
+        if not entry or entry[:2] != [stat.st_mtime_ns, stat.st_size]:
+            return None
+
+        message_count, project_path, last_prompt = entry[2:]
+        return Session(
+            session_id=session_path.stem,
+            project_hash=project_hash,
+            project_path=project_path,
+            session_path=session_path,
+            modified_at=modified_at,
+            message_count=message_count,
+            last_prompt=last_prompt,
+        )
+
+    def _metadata_cache(self) -> Dict[str, list]:
+        """Load the persistent metadata cache on first use.
+
+        A cache written for another projects directory or cache version is
+        discarded and rebuilt.
+        """
+        if self._cache is None:
+            self._cache = {}
+            try:
+                data = _loads(self.cache_path.read_bytes())
+                owner = (data.get("version"), data.get("projects_dir"))
+                if owner == (_CACHE_VERSION, str(self.projects_dir)):
+                    self._cache = data["sessions"]
+            except (OSError, ValueError, KeyError, AttributeError):
+                pass
+        return self._cache
+
+    def _save_cache(self, seen: set) -> None:
+        """Prune deleted files from the cache and write it back if it changed.
+
+        Args:
+            seen: Session file paths that currently exist under projects_dir.
+        """
+        if self._cache is None:
+            return
+
+        for key in [k for k in self._cache if k not in seen]:
+            del self._cache[key]
+            self._cache_dirty = True
+
+        if not self._cache_dirty:
+            return
+
+        tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {
+                        "version": _CACHE_VERSION,
+                        "projects_dir": str(self.projects_dir),
+                        "sessions": self._cache,
+                    },
+                    f,
+                )
+            os.replace(tmp_path, self.cache_path)
+            self._cache_dirty = False
+        except OSError:
+            pass
+
     def _parse_session(
         self, session_path: Path, project_hash: str, modified_at: datetime
     ) -> Optional[Session]:
@@ -89,35 +373,16 @@ class SessionManager:
             Session object or None if parsing fails.
         """
         try:
-            message_count = 0
-            last_prompt = None
-            project_path = None
-
-            with open(session_path, "r") as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-                    try:
-                        msg = json.loads(line)
-                        message_count += 1
-
-                        # Extract project path from init message
-                        if msg.get("type") == "init":
-                            project_path = msg.get("cwd")
-
-                        # Track last user prompt
-                        if msg.get("role") == "user":
-                            content = msg.get("content", "")
-                            if isinstance(content, str):
-                                last_prompt = content[:100]
-                            elif isinstance(content, list):
-                                # Handle content blocks
-                                for block in content:
-                                    if isinstance(block, dict) and block.get("type") == "text":
-                                        last_prompt = block.get("text", "")[:100]
-                                        break
-                    except json.JSONDecodeError:
-                        continue
+            fields = None
+            with open(session_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    fields = (0, None, None)
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        fields = self._scan_session(data)
+            if fields is None:
+                fields = self._parse_session_lines(session_path)
+            message_count, project_path, last_prompt = fields
 
             session_id = session_path.stem
             return Session(
@@ -132,27 +397,147 @@ class SessionManager:
         except Exception:
             return None
 
-    def get_session(self, session_id: str) -> Optional[Session]:
-        """Get a specific session by ID.
+    def _scan_session(self, data) -> Optional[Tuple[int, Optional[str], Optional[str]]]:
+        """Read session metadata without a Python-level pass over every message.
+
+        Every terminated line is decoded in one ``map`` over the decoder so
+        malformed lines are caught, but only the last init line and the last
+        user line are inspected. Files with any line that does not decode to
+        an object (blank, whitespace-only, torn or otherwise malformed) are
+        left to the full parse, which skips such lines.
 
         Args:
-            session_id: The session ID to find.
+            data: Contents of a non-empty session JSONL file.
 
         Returns:
-            Session object or None if not found.
+            (message_count, project_path, last_prompt), or None to fall back.
+        """
+        if len(data) > _SLURP_LIMIT:
+            return None  # the full parse streams large files
+
+        end = data.rfind(b"\n") + 1
+        lines = data[:end].split(b"\n")
+        lines.pop()  # empty remainder after the final newline
+        try:
+            if set(map(type, map(_loads, lines))) - {dict}:
+                return None
+        except ValueError:
+            return None
+        message_count = len(lines)
+
+        if end < len(data):
+            # An unterminated last line may be a message still being written
+            try:
+                if not isinstance(_loads(data[end:]), dict):
+                    return None
+                message_count += 1
+            except ValueError:
+                pass
+
+        init = _last_message(data, _INIT_MARKERS, lambda m: m.get("type") == "init")
+        user = _last_message(
+            data,
+            _USER_MARKERS,
+            lambda m: m.get("role") == "user" and _prompt_from_message(m) is not None,
+        )
+        return (
+            message_count,
+            init.get("cwd") if init else None,
+            _prompt_from_message(user) if user else None,
+        )
+
+    def _parse_session_lines(self, session_path: Path) -> Tuple[int, Optional[str], Optional[str]]:
+        """Read session metadata by decoding every message.
+
+        Args:
+            session_path: Path to the session JSONL file.
+
+        Returns:
+            (message_count, project_path, last_prompt).
         """
-        for project_dir in self.projects_dir.iterdir():
-            if not project_dir.is_dir():
+        message_count = 0
+        last_prompt = None
+        project_path = None
+
+        for line in _iter_lines(session_path):
+            if not line.strip():
+                continue
+            try:
+                msg = _loads(line)
+                message_count += 1
+
+                # Extract project path from init message
+                if msg.get("type") == "init":
+                    project_path = msg.get("cwd")
+
+                # Track last user prompt
+                if msg.get("role") == "user":
+                    prompt = _prompt_from_message(msg)
+                    if prompt is not None:
+                        last_prompt = prompt
+            except json.JSONDecodeError:
                 continue
 
-            session_path = project_dir / f"{session_id}.jsonl"
-            if session_path.exists():
-                stat = session_path.stat()
-                modified_at = datetime.fromtimestamp(stat.st_mtime)
-                return self._parse_session(session_path, project_dir.name, modified_at)
+        return message_count, project_path, last_prompt
+
+    def _locate_session(self, session_id: str) -> Optional[Tuple[str, str, os.stat_result]]:
+        """Find a session file by ID without reading it.
+
+        Args:
+            session_id: The session ID to find.
+
+        Returns:
+            (path, project_hash, stat) or None if not found.
+        """
+        file_name = f"{session_id}.jsonl"
+
+        known_dir = self._session_dirs.get(session_id)
+        if known_dir is not None:
+            session_path = os.path.join(known_dir, file_name)
+            try:
+                return session_path, os.path.basename(known_dir), os.stat(session_path)
+            except OSError:
+                del self._session_dirs[session_id]
+
+        with os.scandir(self.projects_dir) as project_dirs:
+            for project_dir in project_dirs:
+                if not project_dir.is_dir():
+                    continue
+
+                session_path = os.path.join(project_dir.path, file_name)
+                try:
+                    stat = os.stat(session_path)
+                except OSError:
+                    continue
+                self._session_dirs[session_id] = project_dir.path
+                return session_path, project_dir.name, stat
 
         return None
 
+    def _session_for_file(
+        self, session_file: str, project_hash: str, stat: os.stat_result
+    ) -> Optional[Session]:
+        """Build a Session for one file, from the metadata cache when current."""
+        session_path = Path(session_file)
+        modified_at = datetime.fromtimestamp(stat.st_mtime)
+        cache = self._metadata_cache() if self.cache_path is not None else {}
+        session = self._cached_session(cache, session_path, project_hash, modified_at, stat)
+        return session or self._parse_session(session_path, project_hash, modified_at)
+
+    def get_session(self, session_id: str) -> Optional[Session]:
+        """Get a specific session by ID.
+
+        Args:
+            session_id: The session ID to find.
+
+        Returns:
+            Session object or None if not found.
+        """
+        found = self._locate_session(session_id)
+        if found is None:
+            return None
+        return self._session_for_file(*found)
+
     def resume(self, session_id: str, prompt: Optional[str] = None) -> subprocess.Popen:
         """Resume a session with optional new prompt.
 
@@ -194,12 +579,13 @@ class SessionManager:
             text=True,
         )
 
-    def search(self, query: str, hours: float = 168.0) -> List[dict]:
+    def search(self, query: str, hours: float = 168.0, case_sensitive: bool = False) -> List[dict]:
         """Search sessions for matching user prompts.
 
         Args:
             query: Search term to find in user prompts.
             hours: Number of hours to look back (default 168 = 1 week).
+            case_sensitive: Match the query's case exactly.
 
         Returns:
             List of dicts with session info and matching prompts.
@@ -207,84 +593,116 @@ class SessionManager:
         if not self.projects_dir.exists():
             return []
 
-        cutoff = datetime.now() - timedelta(hours=hours)
-        results = []
-        query_lower = query.lower()
-
-        # Scan all project directories
-        for project_dir in self.projects_dir.iterdir():
-            if not project_dir.is_dir():
+        cutoff_ts = time.time() - hours * 3600
+        candidates = []
+        # Compiled once; IGNORECASE avoids lowercasing every prompt
+        flags = 0 if case_sensitive else re.IGNORECASE
+        pattern = re.compile(re.escape(query), flags)
+        # On bytes, IGNORECASE folds ASCII only, which is all a raw needle holds
+        raw_needle = _raw_needle(query)
+        prefilter = None if raw_needle is None else re.compile(re.escape(raw_needle), flags)
+
+        for session_file, project_hash, stat in self._iter_session_files():
+            if stat.st_mtime < cutoff_ts:
                 continue
 
-            project_hash = project_dir.name
-
-            # Find all JSONL session files
-            for session_file in project_dir.glob("*.jsonl"):
-                stat = session_file.stat()
-                modified_at = datetime.fromtimestamp(stat.st_mtime)
-
-                if modified_at < cutoff:
-                    continue
-
-                # Search session for matches
-                match_result = self._search_session(
-                    session_file, project_hash, modified_at, query_lower
+            # datetime is only built for sessions that actually match
+            candidates.append(
+                (
+                    Path(session_file),
+                    project_hash,
+                    stat.st_mtime,
+                    pattern,
+                    prefilter,
                 )
-                if match_result:
-                    results.append(match_result)
+            )
+
+        # Search sessions for matches
+        matched = self._map(lambda c: self._search_session(*c), candidates)
+        results = [match_result for match_result in matched if match_result]
 
         # Sort by match count (most matches first), then by modification time
-        results.sort(key=lambda r: (-r["match_count"], -r["modified_at"].timestamp()))
+        results.sort(key=lambda r: r["modified_at"], reverse=True)
+        results.sort(key=lambda r: r["match_count"], reverse=True)
         return results
 
     def _search_session(
-        self, session_path: Path, project_hash: str, modified_at: datetime, query: str
+        self,
+        session_path: Path,
+        project_hash: str,
+        modified_ts: float,
+        pattern: re.Pattern[str],
+        prefilter: Optional[re.Pattern[bytes]] = None,
     ) -> Optional[dict]:
         """Search a session file for matching user prompts.
 
         Args:
             session_path: Path to the session JSONL file.
             project_hash: Hash of the project directory.
-            modified_at: Modification timestamp.
-            query: Lowercase search query.
+            modified_ts: File mtime as a POSIX timestamp.
+            pattern: Compiled search query.
+            prefilter: The query as a raw-bytes pattern that must appear in
+                       the file for any prompt to match; files without it
+                       are skipped without decoding any JSON.
 
         Returns:
             Dict with session info and matches, or None if no matches.
         """
         try:
+            if session_path.stat().st_size <= _SLURP_LIMIT:
+                data = session_path.read_bytes()
+                if prefilter is not None and not prefilter.search(data):
+                    return None
+                lines = data.split(b"\n")
+            else:
+                # Too big to hold in memory; filter as the lines stream past
+                lines = _iter_lines(session_path)
+
+            if prefilter is not None:
+                # Only user lines containing the needle can match; init lines
+                # are still decoded for the project path
+                lines = (
+                    line
+                    for line in lines
+                    if any(marker in line for marker in _INIT_MARKERS)
+                    or (any(marker in line for marker in _USER_MARKERS) and prefilter.search(line))
+                )
+            else:
+                # Only init and user lines are worth decoding
+                lines = (line for line in lines if any(marker in line for marker in _SCAN_MARKERS))
+
             matches = []
             project_path = None
 
-            with open(session_path, "r") as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-                    try:
-                        msg = json.loads(line)
-
-                        # Extract project path from init message
-                        if msg.get("type") == "init":
-                            project_path = msg.get("cwd")
-
-                        # Search user prompts
-                        if msg.get("role") == "user":
-                            content = msg.get("content", "")
-                            prompt_text = ""
-
-                            if isinstance(content, str):
-                                prompt_text = content
-                            elif isinstance(content, list):
-                                # Handle content blocks
-                                for block in content:
-                                    if isinstance(block, dict) and block.get("type") == "text":
-                                        prompt_text = block.get("text", "")
-                                        break
-
-                            if prompt_text and query in prompt_text.lower():
-                                matches.append(prompt_text[:200])
-
-                    except json.JSONDecodeError:
-                        continue
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    msg = _loads(line)
+
+                    # Extract project path from init message
+                    if msg.get("type") == "init":
+                        project_path = msg.get("cwd")
+
+                    # Search user prompts
+                    if msg.get("role") == "user":
+                        content = msg.get("content", "")
+                        prompt_text = ""
+
+                        if isinstance(content, str):
+                            prompt_text = content
+                        elif isinstance(content, list):
+                            # Handle content blocks
+                            for block in content:
+                                if isinstance(block, dict) and block.get("type") == "text":
+                                    prompt_text = block.get("text", "")
+                                    break
+
+                        if prompt_text and pattern.search(prompt_text):
+                            matches.append(prompt_text[:200])
+
+                except json.JSONDecodeError:
+                    continue
 
             if not matches:
                 return None
@@ -295,7 +713,7 @@ class SessionManager:
                 "project_hash": project_hash,
                 "project_path": project_path,
                 "session_path": str(session_path),
-                "modified_at": modified_at,
+                "modified_at": datetime.fromtimestamp(modified_ts),
                 "match_count": len(matches),
                 "matching_prompts": matches,
                 "sample_prompt": matches[0] if matches else None,
@@ -309,9 +727,21 @@ class SessionManager:
         Returns:
             Session object or None if no sessions found.
         """
+        if not self.projects_dir.exists():
+            return None
+
         # Look back far enough to find at least one session
-        sessions = self.find_recent(hours=168.0)  # 1 week
-        return sessions[0] if sessions else None
+        cutoff_ts = time.time() - 168 * 3600  # 1 week
+        newest = None
+        for entry in self._iter_session_files():
+            mtime = entry[2].st_mtime
+            if mtime >= cutoff_ts and (newest is None or mtime > newest[2].st_mtime):
+                newest = entry
+        if newest is None:
+            return None
+
+        # Only the newest file needs its metadata
+        return self._session_for_file(*newest)
 
     def load_messages(self, session_id: str) -> List[dict]:
         """Load all messages from a session.
@@ -322,27 +752,35 @@ class SessionManager:
         Returns:
             List of message dicts with role and content.
         """
-        session = self.get_session(session_id)
-        if not session:
+        # Messages carry everything needed; skip the metadata pass
+        found = self._locate_session(session_id)
+        if found is None:
             return []
 
-        messages = []
         try:
-            with open(session.session_path, "r") as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-                    try:
-                        msg = json.loads(line)
-                        # Only include user/assistant messages
-                        if msg.get("role") in ("user", "assistant"):
-                            messages.append(msg)
-                    except json.JSONDecodeError:
-                        continue
+            return list(self._iter_messages(Path(found[0])))
         except Exception:
             return []
 
-        return messages
+    def _iter_messages(self, session_path: Path) -> Iterator[dict]:
+        """Yield user/assistant messages from a session file.
+
+        Args:
+            session_path: Path to the session JSONL file.
+
+        Yields:
+            Message dicts with role and content.
+        """
+        for line in _iter_lines(session_path):
+            if not line.strip():
+                continue
+            try:
+                msg = _loads(line)
+                # Only include user/assistant messages
+                if msg.get("role") in ("user", "assistant"):
+                    yield msg
+            except json.JSONDecodeError:
+                continue
 
     def export_to_markdown(self, session_id: str) -> Optional[str]:
         """Export a session to markdown format.
@@ -353,48 +791,54 @@ class SessionManager:
         Returns:
             Markdown string or None if session not found.
         """
-        session = self.get_session(session_id)
-        if not session:
+        chunks = self.iter_markdown(session_id)
+        if chunks is None:
             return None
+        return "".join(chunks)
 
-        messages = self.load_messages(session_id)
+    def iter_markdown(self, session_id: str) -> Optional[Iterator[str]]:
+        """Export a session to markdown, one chunk at a time.
 
-        # Build markdown
-        lines = []
+        Lets callers write long sessions out incrementally instead of
+        holding the whole document in memory.
 
+        Args:
+            session_id: The session ID to export.
+
+        Returns:
+            Iterator of markdown chunks or None if session not found.
+        """
+        session = self.get_session(session_id)
+        if not session:
+            return None
+        return self._iter_markdown(session)
+
+    def _iter_markdown(self, session: Session) -> Iterator[str]:
+        """Yield the markdown export of a session line by line."""
         # Header with metadata
-        lines.append(f"# Session Export: {session.session_id}")
-        lines.append("")
-        lines.append("## Metadata")
-        lines.append("")
-        lines.append(f"- **Session ID:** `{session.session_id}`")
+        yield f"# Session Export: {session.session_id}\n\n"
+        yield "## Metadata\n\n"
+        yield f"- **Session ID:** `{session.session_id}`\n"
         if session.project_path:
-            lines.append(f"- **Project:** `{session.project_path}`")
-        lines.append(f"- **Modified:** {session.modified_at.strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"- **Message Count:** {session.message_count}")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-        lines.append("## Conversation")
-        lines.append("")
-
-        # Messages
-        for msg in messages:
+            yield f"- **Project:** `{session.project_path}`\n"
+        yield f"- **Modified:** {session.modified_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        yield f"- **Message Count:** {session.message_count}\n"
+        yield "\n---\n\n"
+        yield "## Conversation\n"
+
+        # Messages, each preceded by a blank line so none trails the last
+        for msg in self._iter_messages(session.session_path):
             role = msg.get("role", "unknown")
             content = msg.get("content", "")
 
             # Format role header
             role_display = "User" if role == "user" else "Assistant"
-            lines.append(f"### {role_display}")
-            lines.append("")
+            yield f"\n### {role_display}\n\n"
 
             # Extract text content
             text_content = self._extract_content_text(content)
             if text_content:
-                lines.append(text_content)
-            lines.append("")
-
-        return "\n".join(lines)
+                yield text_content + "\n"
 
     def _extract_content_text(self, content) -> str:
         """Extract text from message content.
@@ -422,7 +866,7 @@ class SessionManager:
                         parts.append(f"**Tool: {tool_name}**")
                         if tool_input:
                             parts.append("```json")
-                            parts.append(json.dumps(tool_input, indent=2))
+                            parts.append(_dumps_indented(tool_input))
                             parts.append("```")
                     elif block_type == "tool_result":
                         # Format tool result
@@ -433,7 +877,7 @@ class SessionManager:
                             if isinstance(result_content, str):
                                 parts.append(result_content[:2000])  # Truncate long results
                             else:
-                                parts.append(json.dumps(result_content, indent=2)[:2000])
+                                parts.append(_dumps_indented(result_content)[:2000])
                             parts.append("```")
                 elif isinstance(block, str):
                     parts.append(block)
@@ -462,105 +906,62 @@ class SessionManager:
                 "oldest_sessions": [],
             }
 
-        now = datetime.now()
-        cutoff = now - timedelta(hours=hours)
-        stale_cutoff = now - timedelta(hours=48)  # Stale = no update in 48h
+        now = time.time()
+        cutoff_ts = now - hours * 3600
+        stale_cutoff_ts = now - 48 * 3600  # Stale = no update in 48h
 
         total_bytes = 0
-        all_sessions = []
+        candidates = []
+        seen = set()
+
+        for session_file, project_hash, stat in self._iter_session_files():
+            seen.add(session_file)
 
-        # Scan all project directories
-        for project_dir in self.projects_dir.iterdir():
-            if not project_dir.is_dir():
+            # Only include sessions within the lookback period
+            if stat.st_mtime < cutoff_ts:
                 continue
 
-            project_hash = project_dir.name
+            modified_at = datetime.fromtimestamp(stat.st_mtime)
+            total_bytes += stat.st_size
+            candidates.append((Path(session_file), project_hash, modified_at, stat))
 
-            # Find all JSONL session files
-            for session_file in project_dir.glob("*.jsonl"):
-                try:
-                    stat = session_file.stat()
-                    file_size = stat.st_size
-                    modified_at = datetime.fromtimestamp(stat.st_mtime)
-
-                    # Only include sessions within the lookback period
-                    if modified_at < cutoff:
-                        continue
-
-                    total_bytes += file_size
-
-                    # Parse session for metadata
-                    session = self._parse_session(session_file, project_hash, modified_at)
-                    if session:
-                        all_sessions.append({
-                            "session": session,
-                            "file_size": file_size,
-                            "is_stale": modified_at < stale_cutoff,
-                        })
-                except Exception:
-                    continue
+        # Parse sessions for metadata
+        parsed = self._load_sessions(candidates, seen)
+        missing = _missing_paths(
+            [session.project_path for session in parsed if session and session.project_path]
+        )
 
-        # Calculate counts
-        session_count = len(all_sessions)
-        active_count = sum(1 for s in all_sessions if not s["is_stale"])
-
-        # Find stale sessions (no update in 48h)
-        stale_sessions = [
-            {
-                "session_id": s["session"].session_id,
-                "project_path": s["session"].project_path,
-                "modified_at": s["session"].modified_at,
-                "message_count": s["session"].message_count,
-                "file_size": s["file_size"],
+        # One pass sorts every session into the report buckets
+        all_sessions = []
+        stale_sessions = []  # no update in 48h
+        orphaned_sessions = []  # project path no longer exists
+        large_sessions = []  # unusually large (>1000 messages)
+        for session, (_, _, _, stat) in zip(parsed, candidates):
+            if not session:
+                continue
+            info = {
+                "session_id": session.session_id,
+                "project_path": session.project_path,
+                "modified_at": session.modified_at,
+                "message_count": session.message_count,
+                "file_size": stat.st_size,
             }
-            for s in all_sessions
-            if s["is_stale"]
-        ]
-        # Sort by modified_at (oldest first)
-        stale_sessions.sort(key=lambda x: x["modified_at"])
+            all_sessions.append(info)
+            if stat.st_mtime < stale_cutoff_ts:
+                stale_sessions.append(info)
+            if session.project_path in missing:
+                orphaned_sessions.append(info)
+            if session.message_count > 1000:
+                large_sessions.append(info)
 
-        # Find orphaned sessions (project path no longer exists)
-        orphaned_sessions = []
-        for s in all_sessions:
-            session = s["session"]
-            if session.project_path and not Path(session.project_path).exists():
-                orphaned_sessions.append({
-                    "session_id": session.session_id,
-                    "project_path": session.project_path,
-                    "modified_at": session.modified_at,
-                    "message_count": session.message_count,
-                    "file_size": s["file_size"],
-                })
-
-        # Find unusually large sessions (>1000 messages)
-        large_sessions = [
-            {
-                "session_id": s["session"].session_id,
-                "project_path": s["session"].project_path,
-                "modified_at": s["session"].modified_at,
-                "message_count": s["session"].message_count,
-                "file_size": s["file_size"],
-            }
-            for s in all_sessions
-            if s["session"].message_count > 1000
-        ]
-        # Sort by message count (largest first)
-        large_sessions.sort(key=lambda x: -x["message_count"])
-
-        # Find oldest sessions that could be cleaned up
-        oldest_sessions = sorted(
-            [
-                {
-                    "session_id": s["session"].session_id,
-                    "project_path": s["session"].project_path,
-                    "modified_at": s["session"].modified_at,
-                    "message_count": s["session"].message_count,
-                    "file_size": s["file_size"],
-                }
-                for s in all_sessions
-            ],
-            key=lambda x: x["modified_at"],
-        )[:10]  # Top 10 oldest
+        session_count = len(all_sessions)
+        active_count = session_count - len(stale_sessions)
+
+        # Oldest first
+        stale_sessions.sort(key=lambda x: x["modified_at"])
+        # Top 10 by message count and age, without sorting everything
+        large_sessions = heapq.nlargest(10, large_sessions, key=lambda x: x["message_count"])
+        oldest_sessions = heapq.nsmallest(10, all_sessions, key=lambda x: x["modified_at"])
 
         return {
             "storage_bytes": total_bytes,
@@ -568,6 +969,6 @@ class SessionManager:
             "active_sessions": active_count,
             "stale_sessions": stale_sessions,
             "orphaned_sessions": orphaned_sessions,
-            "largest_sessions": large_sessions[:10],  # Top 10 largest
+            "largest_sessions": large_sessions,
             "oldest_sessions": oldest_sessions,
         }
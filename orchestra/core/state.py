@@ -1,13 +1,46 @@
 """State persistence for orchestrator."""
 
 import json
+import os
+import weakref
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ..config import get_config
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Compact the write-ahead log into a fresh snapshot once it grows past this size
+_WAL_COMPACT_BYTES = 1024 * 1024
+
+
+def _loads(data: bytes):
+    """Decode JSON bytes, using orjson when it is installed."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _dumps_record(record: dict) -> bytes:
+    """Encode a write-ahead log record as compact JSON."""
+    if orjson is not None:
+        return orjson.dumps(record)
+    return json.dumps(record, separators=(",", ":")).encode()
+
+
+def _dumps_snapshot(state: "OrchestratorState") -> bytes:
+    """Encode the full state as indented JSON.
+
+    orjson serializes the dataclasses and datetimes directly, producing the
+    same document as ``to_dict`` without building the intermediate dicts.
+    """
+    if orjson is not None:
+        return orjson.dumps(state, option=orjson.OPT_INDENT_2)
+    return json.dumps(state.to_dict(), indent=2).encode()
+
 
 @dataclass
 class AgentState:
@@ -95,11 +128,18 @@ class StateManager:
     def __init__(self, state_file: Optional[Path] = None):
         """Initialize state manager.
 
+        Small mutations (add, remove, heartbeat, stale) are appended to a
+        write-ahead log next to the state file instead of rewriting the whole
+        snapshot. ``save`` writes a full snapshot and truncates the log.
+
         Args:
             state_file: Path to state file. Defaults to config value.
         """
         self.state_file = state_file or get_config().state_file
+        self.wal_path = self.state_file.with_suffix(".wal")
         self._state: Optional[OrchestratorState] = None
+        self._signature: Optional[Tuple] = None
+        self._wal_fd: Optional[int] = None
 
     @property
     def state(self) -> OrchestratorState:
@@ -108,28 +148,124 @@ class StateManager:
             self._state = self.load()
         return self._state
 
+    def _file_signature(self) -> Tuple:
+        """Return (mtime_ns, size) for the snapshot and the log, None if missing."""
+        signature = []
+        for path in (self.state_file, self.wal_path):
+            try:
+                st = path.stat()
+                signature.append((st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    def reload_if_changed(self) -> bool:
+        """Drop the in-memory state if the file was rewritten since it was read.
+
+        Lets long-running readers such as ``status --watch`` pick up changes
+        made by other processes with two stats per poll.
+
+        Returns:
+            True if the state file changed and will be reloaded on next access.
+        """
+        if self._state is None or self._file_signature() == self._signature:
+            return False
+        self._state = None
+        return True
+
     def load(self) -> OrchestratorState:
         """Load state from file.
 
         Returns:
             OrchestratorState object.
         """
+        self._signature = self._file_signature()
+        state = OrchestratorState()
         if self.state_file.exists():
             try:
-                with open(self.state_file) as f:
-                    data = json.load(f)
-                return OrchestratorState.from_dict(data)
+                state = OrchestratorState.from_dict(_loads(self.state_file.read_bytes()))
             except (json.JSONDecodeError, KeyError):
                 pass
-        return OrchestratorState()
+
+        try:
+            with open(self.wal_path, "rb") as f:
+                for line in f:
+                    try:
+                        self._apply(state, _loads(line))
+                    except (ValueError, KeyError):
+                        continue  # torn trailing write
+        except FileNotFoundError:
+            pass
+        return state
+
+    @staticmethod
+    def _apply(state: OrchestratorState, record: dict) -> None:
+        """Replay one write-ahead log record onto a state snapshot."""
+        op = record["op"]
+        if op == "put":
+            agent = AgentState.from_dict(record["agent"])
+            state.agents[agent.agent_id] = agent
+        elif op == "remove":
+            state.agents.pop(record["id"], None)
+        elif op in ("heartbeat", "status"):
+            agent = state.agents.get(record["id"])
+            if agent is None:
+                return
+            if op == "status":
+                agent.status = record["status"]
+                return
+            agent.last_heartbeat = datetime.fromisoformat(record["ts"])
+            if record.get("activity"):
+                agent.current_activity = record["activity"]
+
+    def _append(self, *records: dict) -> None:
+        """Append records to the write-ahead log, compacting it when large.
+
+        Args:
+            records: Delta records understood by ``_apply``.
+        """
+        if self._wal_fd is None:
+            self.wal_path.parent.mkdir(parents=True, exist_ok=True)
+            self._wal_fd = os.open(self.wal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            weakref.finalize(self, os.close, self._wal_fd)
+
+        # One unbuffered write per call keeps concurrent appenders line-atomic
+        payload = b"".join(_dumps_record(r) + b"\n" for r in records)
+        os.write(self._wal_fd, payload)
+        st = os.fstat(self._wal_fd)
+
+        # The log only grew by our write if no other process touched it since
+        # it was last read; otherwise keep the old signature so
+        # reload_if_changed still notices the other writer.
+        only_ours = False
+        if self._signature is not None:
+            known_wal = self._signature[1]
+            only_ours = st.st_size == (known_wal[1] if known_wal else 0) + len(payload)
+
+        if st.st_size > _WAL_COMPACT_BYTES:
+            if not only_ours:
+                # Replay the other writers' records (and ours) before the
+                # snapshot replaces the log
+                self._state = None
+            self.save()
+        elif only_ours:
+            self._signature = (self._signature[0], (st.st_mtime_ns, st.st_size))
 
     def save(self) -> None:
-        """Save state to file."""
+        """Write a full snapshot to the state file and truncate the log."""
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
         self.state.last_updated = datetime.now()
 
-        with open(self.state_file, "w") as f:
-            json.dump(self.state.to_dict(), f, indent=2)
+        tmp_path = self.state_file.with_name(f"{self.state_file.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(_dumps_snapshot(self.state))
+        os.replace(tmp_path, self.state_file)
+        # Every record is idempotent, so a crash before the truncate only
+        # replays changes the snapshot already contains.
+        try:
+            os.truncate(self.wal_path, 0)
+        except FileNotFoundError:
+            pass
+        self._signature = self._file_signature()
 
     def add_agent(self, agent: AgentState) -> None:
         """Add or update an agent in state.
@@ -138,7 +274,7 @@ class StateManager:
             agent: The agent state to add.
         """
         self.state.agents[agent.agent_id] = agent
-        self.save()
+        self._append({"op": "put", "agent": agent.to_dict()})
 
     def remove_agent(self, agent_id: str) -> None:
         """Remove an agent from state.
@@ -148,7 +284,20 @@ class StateManager:
         """
         if agent_id in self.state.agents:
             del self.state.agents[agent_id]
-            self.save()
+            self._append({"op": "remove", "id": agent_id})
+
+    def remove_agents(self, agent_ids: List[str]) -> None:
+        """Remove several agents from state with a single log write.
+
+        Args:
+            agent_ids: The agent IDs to remove.
+        """
+        removed = []
+        for agent_id in agent_ids:
+            if self.state.agents.pop(agent_id, None) is not None:
+                removed.append(agent_id)
+        if removed:
+            self._append(*({"op": "remove", "id": agent_id} for agent_id in removed))
 
     def get_agent(self, agent_id: str) -> Optional[AgentState]:
         """Get an agent by ID.
@@ -170,10 +319,9 @@ class StateManager:
         Returns:
             List of AgentState objects.
         """
-        agents = list(self.state.agents.values())
         if status:
-            agents = [a for a in agents if a.status == status]
-        return agents
+            return [a for a in self.state.agents.values() if a.status == status]
+        return list(self.state.agents.values())
 
     def update_heartbeat(self, agent_id: str, activity: Optional[str] = None) -> None:
         """Update an agent's heartbeat.
@@ -187,7 +335,14 @@ class StateManager:
             agent.last_heartbeat = datetime.now()
             if activity:
                 agent.current_activity = activity
-            self.save()
+            self._append(
+                {
+                    "op": "heartbeat",
+                    "id": agent_id,
+                    "ts": agent.last_heartbeat.isoformat(),
+                    "activity": activity,
+                }
+            )
 
     def mark_stale_agents(self, threshold_seconds: int = 300) -> List[str]:
         """Mark agents as stale if no recent heartbeat.
@@ -198,17 +353,21 @@ class StateManager:
         Returns:
             List of agent IDs marked as stale.
         """
-        now = datetime.now()
+        cutoff = datetime.now() - timedelta(seconds=threshold_seconds)
         stale_ids = []
 
-        for agent in self.list_agents(status="running"):
-            if agent.last_heartbeat:
-                age = (now - agent.last_heartbeat).total_seconds()
-                if age > threshold_seconds:
-                    agent.status = "stale"
-                    stale_ids.append(agent.agent_id)
+        for agent in self.state.agents.values():
+            if (
+                agent.status == "running"
+                and agent.last_heartbeat is not None
+                and agent.last_heartbeat < cutoff
+            ):
+                agent.status = "stale"
+                stale_ids.append(agent.agent_id)
 
         if stale_ids:
-            self.save()
+            self._append(
+                *({"op": "status", "id": agent_id, "status": "stale"} for agent_id in stale_ids)
+            )
 
         return stale_ids
@@ -1,13 +1,56 @@
 """Git worktree management for isolated agent execution."""
 
+import logging
+import os
+import re
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ..config import get_config
 
+logger = logging.getLogger(__name__)
+
+# How long list_active reuses one `git worktree list` result
+_LIST_CACHE_SECONDS = 2.0
+
+# A `git worktree list --porcelain` record's path and branch, keyed by the
+# field separator (NUL with -z, newline without)
+_WORKTREE_RECORDS = {
+    sep: re.compile(f"worktree ([^{sep}]*){sep}HEAD [0-9a-f]+{sep}branch refs/heads/([^{sep}]*)")
+    for sep in ("\0", "\n")
+}
+
+_TASK_SEPARATORS = str.maketrans({" ": "-", "/": "-"})
+
+
+def _safe_task(task: str) -> str:
+    """Return the branch- and path-safe form of a task name."""
+    return task.lower().translate(_TASK_SEPARATORS)[:50]
+
+
+def _checked_out_branch(path: Path) -> Optional[str]:
+    """Read the branch checked out in a linked worktree from its git files.
+
+    Args:
+        path: Worktree directory.
+
+    Returns:
+        Branch name, or None if path is not a linked worktree on a branch.
+    """
+    try:
+        gitdir = (path / ".git").read_text().strip()
+        head = (path / gitdir.removeprefix("gitdir: ") / "HEAD").read_text().strip()
+    except OSError:
+        return None
+    if not gitdir.startswith("gitdir: ") or not head.startswith("ref: refs/heads/"):
+        return None
+    return head[len("ref: refs/heads/") :]
+
 
 @dataclass
 class Worktree:
@@ -34,6 +77,8 @@ class WorktreeManager:
         self.repo_path = repo_path or Path.cwd()
         self.worktree_dir = worktree_dir or get_config().worktree_dir
         self.branch_prefix = get_config().branch_prefix
+        # (monotonic time, worktrees keyed by task) from the last listing
+        self._active_cache: Optional[Tuple[float, Dict[str, Worktree]]] = None
 
     @property
     def worktrees_root(self) -> Path:
@@ -54,42 +99,29 @@ class WorktreeManager:
             RuntimeError: If worktree creation fails.
         """
         # Sanitize task name for branch
-        safe_task = task.lower().replace(" ", "-").replace("/", "-")[:50]
+        safe_task = _safe_task(task)
         branch_name = f"{self.branch_prefix}/{safe_task}"
         worktree_path = self.worktrees_root / f"task-{safe_task}"
 
         # Create worktrees directory if needed
         self.worktrees_root.mkdir(parents=True, exist_ok=True)
 
-        # Get base branch if not specified
-        if base_branch is None:
-            result = subprocess.run(
-                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-            )
-            base_branch = result.stdout.strip() or "main"
-
-        # Create the worktree with new branch
-        try:
-            subprocess.run(
-                ["git", "worktree", "add", "-b", branch_name, str(worktree_path), base_branch],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-        except subprocess.CalledProcessError:
-            # Branch might already exist, try without -b
-            subprocess.run(
-                ["git", "worktree", "add", str(worktree_path), branch_name],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=True,
+        # Check out an existing branch as is; otherwise create it; without an
+        # explicit base, git starts it from HEAD
+        if self._branch_exists(branch_name):
+            add_cmd = ["git", "worktree", "add", str(worktree_path), branch_name]
+        else:
+            add_cmd = ["git", "worktree", "add", "-b", branch_name, str(worktree_path)]
+            if base_branch is not None:
+                add_cmd.append(base_branch)
+
+        result = subprocess.run(add_cmd, cwd=self.repo_path, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"Failed to create worktree for {branch_name}: {result.stderr.strip()}"
             )
 
+        self._active_cache = None
         return Worktree(
             path=worktree_path,
             branch=branch_name,
@@ -98,44 +130,103 @@ class WorktreeManager:
             is_active=True,
         )
 
-    def list_active(self) -> List[Worktree]:
-        """List all active worktrees.
+    def _branch_exists(self, branch: str) -> bool:
+        """Check whether a local branch exists."""
+        result = self._git_read("show-ref", "--verify", "--quiet", f"refs/heads/{branch}")
+        return result.returncode == 0
+
+    def _git_read(self, *args: str) -> subprocess.CompletedProcess:
+        """Run a read-only git command in the repository.
+
+        --no-optional-locks (GIT_OPTIONAL_LOCKS=0 for git's children) keeps
+        queries from taking index locks that agents committing in their
+        worktrees would otherwise wait on.
+
+        Args:
+            args: Arguments after ``git``.
 
         Returns:
-            List of Worktree objects.
+            The completed process with text stdout and stderr.
         """
-        result = subprocess.run(
-            ["git", "worktree", "list", "--porcelain"],
+        return subprocess.run(
+            ["git", "--no-optional-locks", *args],
             cwd=self.repo_path,
             capture_output=True,
             text=True,
         )
 
+    def list_active(self) -> List[Worktree]:
+        """List all active worktrees.
+
+        Results are reused for a couple of seconds so dashboard polling and
+        repeated lookups share one git call; changes made through this
+        manager invalidate them immediately.
+
+        Returns:
+            List of Worktree objects.
+        """
+        return list(self._active_by_task().values())
+
+    def _active_by_task(self) -> Dict[str, Worktree]:
+        """Return active worktrees keyed by task, refreshing a stale listing."""
+        now = time.monotonic()
+        if self._active_cache is None or now - self._active_cache[0] >= _LIST_CACHE_SECONDS:
+            self._active_cache = (now, {wt.task: wt for wt in self._list_worktrees()})
+        return self._active_cache[1]
+
+    def _list_worktrees(self) -> List[Worktree]:
+        """Run git worktree list and parse the orchestra worktrees."""
+        # -z (git 2.36+) NUL-terminates fields, so paths may contain newlines
+        sep = "\0"
+        result = self._git_read("worktree", "list", "--porcelain", "-z")
+        if result.returncode != 0:
+            sep = "\n"
+            result = self._git_read("worktree", "list", "--porcelain")
+
         worktrees = []
-        current_path = None
-        current_branch = None
-
-        for line in result.stdout.split("\n"):
-            if line.startswith("worktree "):
-                current_path = Path(line.split(" ", 1)[1])
-            elif line.startswith("branch refs/heads/"):
-                current_branch = line.split("refs/heads/", 1)[1]
-
-                # Only include orchestra worktrees
-                if current_branch and current_branch.startswith(self.branch_prefix + "/"):
-                    task = current_branch.split("/", 1)[1]
-                    worktrees.append(
-                        Worktree(
-                            path=current_path,
-                            branch=current_branch,
-                            task=task,
-                            created_at=datetime.now(),  # Would need file stat for real time
-                            is_active=True,
-                        )
+        branch_start = f"{self.branch_prefix}/"
+        stats = self._worktree_dir_stats()
+
+        # One regex scan finds every worktree with a branch checked out
+        for path_str, branch in _WORKTREE_RECORDS[sep].findall(result.stdout):
+            # Only include orchestra worktrees
+            if branch.startswith(branch_start):
+                path = Path(path_str)
+                worktrees.append(
+                    Worktree(
+                        path=path,
+                        branch=branch,
+                        task=branch[len(branch_start) :],
+                        created_at=self._created_at(path, stats),
+                        is_active=True,
                     )
+                )
 
         return worktrees
 
+    def _worktree_dir_stats(self) -> Dict[str, os.stat_result]:
+        """Stat every directory under worktrees_root with a single scandir."""
+        try:
+            with os.scandir(self.worktrees_root) as entries:
+                return {entry.name: entry.stat() for entry in entries if entry.is_dir()}
+        except OSError:
+            return {}
+
+    def _created_at(self, path: Path, stats: Dict[str, os.stat_result]) -> datetime:
+        """Best-effort creation time of a worktree directory.
+
+        Uses the birth time where the platform reports it and the inode
+        change time otherwise. Paths outside worktrees_root are stat'ed
+        individually.
+        """
+        st = stats.get(path.name) if path.parent == self.worktrees_root else None
+        if st is None:
+            try:
+                st = path.stat()
+            except OSError:
+                return datetime.now()
+        return datetime.fromtimestamp(getattr(st, "st_birthtime", st.st_ctime))
+
     def get_worktree(self, task: str) -> Optional[Worktree]:
         """Get a worktree by task name.
 
@@ -145,11 +236,24 @@ class WorktreeManager:
         Returns:
             Worktree object or None if not found.
         """
-        safe_task = task.lower().replace(" ", "-").replace("/", "-")[:50]
-        for wt in self.list_active():
-            if wt.task == safe_task:
-                return wt
-        return None
+        safe_task = _safe_task(task)
+        cache = self._active_cache
+        if cache is not None and time.monotonic() - cache[0] < _LIST_CACHE_SECONDS:
+            return cache[1].get(safe_task)
+
+        # Worktrees made by create() live at a predictable path; confirm it
+        # has the expected branch checked out without running git
+        path = self.worktrees_root / f"task-{safe_task}"
+        branch = f"{self.branch_prefix}/{safe_task}"
+        if _checked_out_branch(path) == branch:
+            return Worktree(
+                path=path,
+                branch=branch,
+                task=safe_task,
+                created_at=self._created_at(path, {}),
+                is_active=True,
+            )
+        return self._active_by_task().get(safe_task)
 
     def cleanup(self, merged_only: bool = True) -> int:
         """Remove worktrees that are no longer needed.
@@ -160,55 +264,137 @@ class WorktreeManager:
         Returns:
             Number of worktrees removed.
         """
-        removed = 0
         worktrees = self.list_active()
 
-        for wt in worktrees:
-            should_remove = False
+        merged_branches = frozenset()
+        if merged_only and worktrees:
+            # Ask once for every branch merged into main. --format drops the
+            # "* " and "+ " markers git adds for checked-out branches.
+            result = self._git_read("branch", "--merged", "main", "--format=%(refname:short)")
+            merged_branches = frozenset(result.stdout.split())
 
-            if merged_only:
-                # Check if branch is merged into main
-                result = subprocess.run(
-                    ["git", "branch", "--merged", "main"],
-                    cwd=self.repo_path,
-                    capture_output=True,
-                    text=True,
-                )
-                merged_branches = [b.strip().lstrip("* ") for b in result.stdout.split("\n")]
-                should_remove = wt.branch in merged_branches
-            else:
-                should_remove = True
+        to_remove = [wt for wt in worktrees if not merged_only or wt.branch in merged_branches]
+        if merged_only:
+            # A branch with no commits of its own also counts as merged
+            to_remove = self._without_pending_work(to_remove)
+        # Everything left is merged and clean unless the caller asked for all
+        removed = self._remove_all(to_remove, force=not merged_only, merged=merged_only)
+        return len(removed)
 
-            if should_remove:
-                self.remove(wt)
-                removed += 1
+    def _without_pending_work(self, worktrees: List[Worktree]) -> List[Worktree]:
+        """Drop worktrees that may hold work not yet in main.
 
-        return removed
+        ``git branch --merged`` also reports branches that never got a
+        commit, such as one an agent was just started on. Keep those, and
+        any worktree with uncommitted changes.
+
+        Args:
+            worktrees: Candidates whose branches are merged.
 
-    def remove(self, worktree: Worktree) -> None:
+        Returns:
+            The candidates that are safe to remove.
+        """
+        if not worktrees:
+            return []
+
+        common_dir = self._git_read("rev-parse", "--git-common-dir").stdout.strip()
+        logs_dir = self.repo_path / common_dir / "logs" / "refs" / "heads"
+
+        def has_pending_work(worktree: Worktree) -> bool:
+            # The branch reflog has a single entry until the first commit
+            try:
+                with open(logs_dir / worktree.branch, "rb") as f:
+                    if sum(1 for _ in f) <= 1:
+                        logger.info("worktree-skipped: pre-work %s", worktree.branch)
+                        return True
+            except OSError:
+                pass  # no reflog to go by
+
+            status = self._git_read("-C", str(worktree.path), "status", "--porcelain")
+            if status.returncode != 0 or status.stdout.strip():
+                logger.info("worktree-skipped: uncommitted changes %s", worktree.branch)
+                return True
+            return False
+
+        if len(worktrees) == 1:
+            pending = [has_pending_work(worktrees[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(worktrees))) as pool:
+                pending = list(pool.map(has_pending_work, worktrees))
+        return [wt for wt, skip in zip(worktrees, pending) if not skip]
+
+    def remove(self, worktree: Worktree, force: bool = False) -> bool:
         """Remove a specific worktree.
 
         Args:
             worktree: The worktree to remove.
+            force: Also discard uncommitted changes and unmerged commits.
+                   Without it git keeps a dirty worktree and an unmerged
+                   branch in place.
+
+        Returns:
+            True if the worktree was removed, False if git refused.
         """
-        # Remove worktree
-        subprocess.run(
-            ["git", "worktree", "remove", str(worktree.path), "--force"],
-            cwd=self.repo_path,
-            capture_output=True,
-            text=True,
-        )
+        return bool(self._remove_all([worktree], force=force))
 
-        # Optionally delete the branch
-        subprocess.run(
-            ["git", "branch", "-D", worktree.branch],
-            cwd=self.repo_path,
-            capture_output=True,
-            text=True,
-        )
+    def _remove_all(
+        self, worktrees: List[Worktree], force: bool = False, merged: bool = False
+    ) -> List[Worktree]:
+        """Remove worktrees and delete their branches.
+
+        Checkouts are deleted concurrently since each touches only its own
+        directory and admin entry; the branches are then deleted by a single
+        git call so concurrent ref updates never contend for locks. Only
+        branches whose checkout was actually removed are deleted.
+
+        Args:
+            worktrees: The worktrees to remove.
+            force: Pass --force to worktree removal and use branch -D.
+            merged: The branches were already checked against main. ``branch -d``
+                    would judge them against whatever HEAD the main checkout
+                    is on, so delete them with -D instead.
+
+        Returns:
+            The worktrees that were removed.
+        """
+        if not worktrees:
+            return []
+        self._active_cache = None
+        force_args = ["--force"] if force else []
+
+        def remove_checkout(worktree: Worktree) -> bool:
+            result = subprocess.run(
+                ["git", "worktree", "remove", *force_args, str(worktree.path)],
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True,
+            )
+            return result.returncode == 0
+
+        if len(worktrees) == 1:
+            results = [remove_checkout(worktrees[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(worktrees))) as pool:
+                results = list(pool.map(remove_checkout, worktrees))
+            # git can fail a removal when a concurrent one deletes an admin
+            # entry it is listing; such a checkout is untouched, so retry
+            # failures one at a time
+            results = [ok or remove_checkout(wt) for wt, ok in zip(worktrees, results)]
+
+        removed = [wt for wt, ok in zip(worktrees, results) if ok]
+        if removed:
+            delete_flag = "-D" if force or merged else "-d"
+            subprocess.run(
+                ["git", "branch", delete_flag, *(wt.branch for wt in removed)],
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True,
+            )
+        return removed
 
     def prune(self) -> None:
         """Prune stale worktree metadata."""
+        self._active_cache = None
         subprocess.run(
             ["git", "worktree", "prune"],
             cwd=self.repo_path,
@@ -1,25 +1,107 @@
 """FastAPI web server for the dashboard."""
 
 import asyncio
-from typing import List, Optional
+import contextlib
+import gzip
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+from pydantic import BaseModel, Field
+
+from ..config import get_config
+from ..core import Orchestrator, SessionManager
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when it is installed."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content)
+        return super().render(content)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the event-loop-bound push state for one run of the app.
+
+    asyncio primitives belong to the loop that first waits on them, so
+    they are made per run rather than at import.
+    """
+    # Set by API calls that change agents so clients hear about it right away
+    app.state.status_changed = asyncio.Event()
+    app.state.status_task = None
+    # SessionManager's metadata cache is not thread-safe; one scan at a time
+    app.state.sessions_lock = asyncio.Lock()
+    try:
+        yield
+    finally:
+        task = app.state.status_task
+        if task is not None:
+            task.cancel()
+            await asyncio.wait({task})
+
+
+app = FastAPI(
+    title="Claude Orchestra Dashboard",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan,
+)
+
+
+def _encode(data: Any) -> str:
+    """Serialize a WebSocket payload, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, separators=(",", ":"))
+
+
+# Global orchestrator instance; its session and worktree managers also serve
+# the read-only endpoints so their caches persist across requests
+orchestrator = Orchestrator(
+    session_manager=SessionManager(cache_path=get_config().session_cache_file)
+)
+
+# Seconds an encoded /api/sessions or /api/worktrees body is served again
+RESPONSE_TTL = 1.0
+_response_cache: Dict[Tuple, Tuple[float, bytes]] = {}
+
+
+def _cached_response(key: Tuple) -> Optional[Response]:
+    """Return the cached JSON body for key if it is younger than RESPONSE_TTL."""
+    entry = _response_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < RESPONSE_TTL:
+        return Response(entry[1], media_type="application/json")
+    return None
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel
 
-from ..core import Orchestrator
+def _cache_response(key: Tuple, data: Any) -> Response:
+    """Encode data once, remember the body under key and return it as a response."""
+    body = _encode(data).encode()
+    if len(_response_cache) >= 32:
+        _response_cache.clear()  # ?hours= is free-form; don't grow without bound
+    _response_cache[key] = (time.monotonic(), body)
+    return Response(body, media_type="application/json")
 
-app = FastAPI(title="Claude Orchestra Dashboard")
 
-# Global orchestrator instance
-orchestrator = Orchestrator()
+# Most tasks a single /api/spawn request may list
+MAX_SPAWN_TASKS = 64
 
 
 class SpawnRequest(BaseModel):
     """Request to spawn agents."""
 
-    tasks: List[str]
-    parallel: Optional[int] = 3
+    # Bounded so oversized requests fail validation before any spawning
+    tasks: List[str] = Field(max_length=MAX_SPAWN_TASKS)
+    parallel: Optional[int] = Field(default=3, ge=1)
     use_worktrees: Optional[bool] = True
 
 
@@ -29,24 +111,82 @@ class AgentAction(BaseModel):
     agent_id: str
 
 
-# WebSocket connections for real-time updates
-connections: List[WebSocket] = []
+# WebSocket connections for real-time updates, each with its outbound queue
+connections: Dict[WebSocket, asyncio.Queue] = {}
+
+# Seconds between status checks, how long a snapshot is reused, and the
+# longest gap between pushes when nothing changes
+STATUS_INTERVAL = 2.0
+STATUS_TTL = 0.5
+STATUS_KEEPALIVE = 30.0
+# Seconds a client gets to accept a message before it is disconnected, and
+# how many undelivered messages it may have pending
+SEND_TIMEOUT = 2.0
+CLIENT_QUEUE_SIZE = 1
+
+_status_cache: Optional[Tuple[float, dict]] = None
+# Last snapshot sent to clients and when
+_last_broadcast: Tuple[float, Optional[dict]] = (0.0, None)
+# Most recently encoded snapshot and its JSON text
+_status_message: Tuple[Optional[dict], str] = (None, "")
+
+
+def cached_status(max_age: float = STATUS_TTL) -> dict:
+    """Return orchestrator status, reusing a snapshot younger than max_age.
+
+    Args:
+        max_age: Seconds a previous snapshot stays valid; 0 forces a refresh.
+
+    Returns:
+        Status dict as returned by Orchestrator.status().
+    """
+    global _status_cache
+    now = time.monotonic()
+    if _status_cache is None or now - _status_cache[0] >= max_age:
+        _status_cache = (now, orchestrator.status())
+    return _status_cache[1]
+
+
+def status_message(status: dict) -> str:
+    """Return the WebSocket payload for a snapshot, encoding it only when it changed.
+
+    Keepalive pushes and newly connected clients reuse the text of the
+    previous snapshot instead of serializing an identical one again.
+
+    Args:
+        status: Snapshot as returned by cached_status().
+
+    Returns:
+        The snapshot encoded as JSON text.
+    """
+    global _status_message
+    previous, message = _status_message
+    if status is not previous and status != previous:
+        message = _encode(status)
+        _status_message = (status, message)
+    return message
 
 
 @app.get("/api/status")
 async def get_status():
     """Get current orchestrator status."""
-    return orchestrator.status()
+    return cached_status()
 
 
 @app.get("/api/sessions")
 async def get_sessions(hours: float = 4.0):
     """Get recent sessions."""
-    from ..core import SessionManager
-
-    manager = SessionManager()
-    sessions = manager.find_recent(hours=hours)
-    return [
+    key = ("sessions", hours)
+    cached = _cached_response(key)
+    if cached is not None:
+        return cached
+    # Scanning session files is blocking I/O; keep the event loop free
+    async with app.state.sessions_lock:
+        cached = _cached_response(key)  # filled while we waited for the lock
+        if cached is not None:
+            return cached
+        sessions = await asyncio.to_thread(orchestrator.sessions.find_recent, hours=hours)
+    payload = [
         {
             "session_id": s.session_id,
             "project_path": s.project_path,
@@ -56,16 +196,19 @@ async def get_sessions(hours: float = 4.0):
         }
         for s in sessions
     ]
+    return _cache_response(key, payload)
 
 
 @app.get("/api/worktrees")
 async def get_worktrees():
     """Get active worktrees."""
-    from ..core import WorktreeManager
-
-    manager = WorktreeManager()
-    worktrees = manager.list_active()
-    return [
+    key = ("worktrees",)
+    cached = _cached_response(key)
+    if cached is not None:
+        return cached
+    # git runs as a blocking subprocess; keep the event loop free
+    worktrees = await asyncio.to_thread(orchestrator.worktrees.list_active)
+    payload = [
         {
             "branch": wt.branch,
             "task": wt.task,
@@ -74,6 +217,7 @@ async def get_worktrees():
         }
         for wt in worktrees
     ]
+    return _cache_response(key, payload)
 
 
 @app.post("/api/spawn")
@@ -85,8 +229,9 @@ async def spawn_agents(request: SpawnRequest):
         use_worktrees=request.use_worktrees,
     )
 
-    # Notify WebSocket clients
-    await broadcast_status()
+    # New worktrees; wake the push task to notify WebSocket clients
+    _response_cache.pop(("worktrees",), None)
+    app.state.status_changed.set()
 
     return {
         "spawned": len(handles),
@@ -105,7 +250,7 @@ async def spawn_agents(request: SpawnRequest):
 async def pause_agent(agent_id: str):
     """Pause an agent."""
     success = orchestrator.pause(agent_id)
-    await broadcast_status()
+    app.state.status_changed.set()
     return {"success": success}
 
 
@@ -113,7 +258,7 @@ async def pause_agent(agent_id: str):
 async def resume_agent(agent_id: str):
     """Resume a paused agent."""
     handle = orchestrator.resume_agent(agent_id)
-    await broadcast_status()
+    app.state.status_changed.set()
     return {"success": handle is not None}
 
 
@@ -121,7 +266,8 @@ async def resume_agent(agent_id: str):
 async def cleanup_agents(all_agents: bool = False):
     """Clean up completed agents."""
     cleaned = orchestrator.cleanup(completed_only=not all_agents)
-    await broadcast_status()
+    _response_cache.pop(("worktrees",), None)
+    app.state.status_changed.set()
     return {"cleaned": cleaned}
 
 
@@ -129,38 +275,97 @@ async def cleanup_agents(all_agents: bool = False):
 async def websocket_status(websocket: WebSocket):
     """WebSocket for real-time status updates."""
     await websocket.accept()
-    connections.append(websocket)
+
+    # Queue the initial status; a relay task delivers this client's messages
+    queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+    queue.put_nowait(status_message(cached_status()))
+    connections[websocket] = queue
+    relay = asyncio.create_task(_relay(websocket, queue))
+    receiver = asyncio.create_task(_receive_until_closed(websocket))
+
+    # One shared task pushes periodic updates to every client
+    task = app.state.status_task
+    if task is None or task.done():
+        app.state.status_task = asyncio.create_task(_push_status_periodically())
 
     try:
-        # Send initial status
-        await websocket.send_json(orchestrator.status())
+        # Finish when the client goes away or stops accepting messages
+        await asyncio.wait({relay, receiver}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        connections.pop(websocket, None)
+        relay.cancel()
+        receiver.cancel()
+        await asyncio.wait({relay, receiver})
+
+
+async def _relay(websocket: WebSocket, queue: asyncio.Queue):
+    """Send queued messages to one client until a send fails or times out."""
+    try:
+        while True:
+            message = await queue.get()
+            await asyncio.wait_for(websocket.send_text(message), timeout=SEND_TIMEOUT)
+    except Exception:
+        pass  # closed or stalled socket; the handler drops the client
 
-        # Keep connection alive and send periodic updates
+
+async def _receive_until_closed(websocket: WebSocket):
+    """Read and discard client messages until the socket closes."""
+    try:
         while True:
-            await asyncio.sleep(2)
-            await websocket.send_json(orchestrator.status())
+            await websocket.receive_text()
     except WebSocketDisconnect:
-        connections.remove(websocket)
+        pass
     except Exception:
-        if websocket in connections:
-            connections.remove(websocket)
+        pass  # e.g. the socket closed mid-read
+
 
+async def _push_status_periodically():
+    """Push status to clients when an API call changes it, or when polling sees a change.
 
-async def broadcast_status():
-    """Broadcast status to all WebSocket clients."""
-    status = orchestrator.status()
-    for connection in connections:
+    Agents also finish or go stale on their own, so status is still checked
+    every STATUS_INTERVAL. Unchanged snapshots are resent only every
+    STATUS_KEEPALIVE seconds.
+    """
+    status_changed = app.state.status_changed
+    while connections:
         try:
-            await connection.send_json(status)
-        except Exception:
+            await asyncio.wait_for(status_changed.wait(), timeout=STATUS_INTERVAL)
+        except asyncio.TimeoutError:
             pass
-
-
-# Serve static dashboard
-@app.get("/", response_class=HTMLResponse)
-async def dashboard():
-    """Serve the dashboard HTML."""
-    return """
+        else:
+            status_changed.clear()
+            await broadcast_status()
+            continue
+
+        status = cached_status()
+        sent_at, sent = _last_broadcast
+        if status != sent or time.monotonic() - sent_at >= STATUS_KEEPALIVE:
+            await broadcast_status(status)
+
+
+async def broadcast_status(status: Optional[dict] = None):
+    """Queue status for every WebSocket client without waiting on sends.
+
+    A client whose queue is full drops its oldest message; for status
+    snapshots only the latest one matters.
+
+    Args:
+        status: Snapshot to send. Defaults to a fresh one, as needed after
+                a change made by an API call.
+    """
+    global _last_broadcast
+    if status is None:
+        status = cached_status(max_age=0)
+    _last_broadcast = (time.monotonic(), status)
+    message = status_message(status)  # once for all clients
+    for queue in connections.values():
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(message)
+
+
+# Static dashboard page
+DASHBOARD_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -465,3 +670,18 @@ async def dashboard():
 </body>
 </html>
 """
+
+# Encoded and compressed once at import instead of on every request
+_DASHBOARD_BYTES = DASHBOARD_HTML.encode("utf-8")
+_DASHBOARD_GZIP = gzip.compress(_DASHBOARD_BYTES, compresslevel=9)
+_DASHBOARD_HEADERS = {"Cache-Control": "public, max-age=300", "Vary": "Accept-Encoding"}
+
+
+@app.get("/", response_class=HTMLResponse)
+async def dashboard(request: Request):
+    """Serve the dashboard HTML, gzipped when the client accepts it."""
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return HTMLResponse(
+            _DASHBOARD_GZIP, headers={**_DASHBOARD_HEADERS, "Content-Encoding": "gzip"}
+        )
+    return HTMLResponse(_DASHBOARD_BYTES, headers=_DASHBOARD_HEADERS)
@@ -0,0 +1,8 @@
+"""Shared pytest configuration."""
+
+import os
+
+# Keep tmp_path directories (and the git repositories the worktree tests
+# build in them) in RAM where a tmpfs is available
+if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+    os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", "/dev/shm")
@@ -0,0 +1,136 @@
+"""Tests for agent orchestration."""
+
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from orchestra.core.agent import _OUTPUT_TAIL_BYTES, AgentHandle, Orchestrator, _decode_tail
+from orchestra.core.state import AgentState, StateManager
+
+
+@pytest.fixture
+def orchestrator():
+    """Create an orchestrator with a temporary state file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state = StateManager(state_file=Path(tmpdir) / "state.json")
+        yield Orchestrator(repo_path=Path(tmpdir), state_manager=state)
+
+
+def _start(orchestrator, agent_id, code):
+    """Start a Python subprocess and register it as a running agent."""
+    process = subprocess.Popen(
+        [sys.executable, "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=0,
+    )
+    orchestrator.state.add_agent(
+        AgentState(
+            agent_id=agent_id,
+            session_id=None,
+            worktree_path=None,
+            task=f"task {agent_id}",
+            status="running",
+            started_at=datetime.now(),
+            last_heartbeat=datetime.now(),
+        )
+    )
+    handle = AgentHandle(agent_id=agent_id, process=process, worktree=None, task=f"task {agent_id}")
+    orchestrator._handles[agent_id] = handle
+    return handle
+
+
+def test_collect_waits_for_agents_concurrently(orchestrator):
+    """Test that collect time tracks the slowest agent, not the sum."""
+    for agent_id in ("a1", "a2", "a3"):
+        _start(orchestrator, agent_id, "import time; time.sleep(0.5); print('done')")
+
+    start = time.monotonic()
+    results = orchestrator.collect_sync()
+    elapsed = time.monotonic() - start
+
+    assert set(results) == {"a1", "a2", "a3"}
+    assert all(r.success for r in results.values())
+    assert elapsed < 1.4
+    assert orchestrator._handles == {}
+
+
+def test_collect_records_failures(orchestrator):
+    """Test that a failing agent is marked failed with its stderr."""
+    _start(orchestrator, "bad", "import sys; sys.stderr.write('boom'); sys.exit(2)")
+
+    results = orchestrator.collect_sync()
+
+    assert not results["bad"].success
+    assert "boom" in results["bad"].error
+    assert orchestrator.state.get_agent("bad").status == "failed"
+
+
+def test_collect_drains_large_output(orchestrator):
+    """Test that output larger than a pipe buffer is read from both pipes."""
+    _start(
+        orchestrator,
+        "big",
+        "import sys; sys.stderr.write('e' * 200000); print('o' * 200000); sys.exit(1)",
+    )
+
+    result = orchestrator.collect_sync()["big"]
+
+    assert result.output.strip() == "o" * (_OUTPUT_TAIL_BYTES - 1)
+    assert result.error == "e" * _OUTPUT_TAIL_BYTES
+    assert orchestrator.state.get_agent("big").result.endswith("o\n")
+
+
+def test_decode_tail_starts_on_character_boundary():
+    """Test that a tail cut inside a multi-byte character drops the fragment."""
+    data = ("x" + "é" * 10).encode()
+
+    assert _decode_tail(data, limit=5) == "éé"
+    assert _decode_tail(data, limit=len(data)) == "x" + "é" * 10
+
+
+def test_status_counts_agents_by_state(orchestrator):
+    """Test that status() tallies each agent state."""
+    for agent_id, agent_status in [("r1", "running"), ("r2", "running"), ("f1", "failed")]:
+        orchestrator.state.add_agent(
+            AgentState(
+                agent_id=agent_id,
+                session_id=None,
+                worktree_path=None,
+                task=f"task {agent_id}",
+                status=agent_status,
+                last_heartbeat=datetime.now(),
+            )
+        )
+
+    status = orchestrator.status()
+
+    assert (status["total"], status["running"], status["failed"]) == (3, 2, 1)
+    assert (status["completed"], status["stale"]) == (0, 0)
+    assert len(status["agents"]) == 3
+
+
+def test_collect_and_cleanup_save_state_once(orchestrator, monkeypatch):
+    """Test that collecting N agents saves once and cleanup only appends to the log."""
+    for agent_id in ("a1", "a2", "a3"):
+        _start(orchestrator, agent_id, "print('done')")
+
+    saves = []
+    real_save = orchestrator.state.save
+    monkeypatch.setattr(orchestrator.state, "save", lambda: saves.append(1) or real_save())
+
+    orchestrator.collect_sync()
+    assert len(saves) == 1
+    on_disk = StateManager(state_file=orchestrator.state.state_file)
+    assert {a.status for a in on_disk.list_agents()} == {"completed"}
+
+    assert orchestrator.cleanup() == 3
+    assert len(saves) == 1
+    assert orchestrator.state.list_agents() == []
+    on_disk = StateManager(state_file=orchestrator.state.state_file)
+    assert on_disk.list_agents() == []
@@ -11,12 +11,39 @@ from click.testing import CliRunner
 from orchestra.cli import main
 
 
+def _jsonl(*messages: dict) -> bytes:
+    """Encode messages as a session JSONL file body."""
+    return "".join(json.dumps(m) + "\n" for m in messages).encode()
+
+
+# Session file bodies, encoded once for every test that uses them
+_AUTH_SESSION = _jsonl(
+    {"type": "init", "cwd": "/test/myproject"},
+    {"role": "user", "content": "Help me fix the authentication bug"},
+    {"role": "assistant", "content": "I'll help you with that."},
+    {"role": "user", "content": "Also update the auth middleware"},
+)
+_REFACTOR_SESSION = _jsonl(
+    {"type": "init", "cwd": "/test/another"},
+    {"role": "user", "content": "Refactor the database layer"},
+    {"role": "assistant", "content": "Sure, let me help."},
+)
+
+
 @pytest.fixture
 def runner():
     """Create a CLI test runner."""
     return CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def session_cache_path(tmp_path, monkeypatch):
+    """Keep CLI runs away from the user's session metadata cache."""
+    cache_path = tmp_path / "sessions.json"
+    monkeypatch.setattr("orchestra.cli._session_cache_path", lambda: cache_path)
+    return cache_path
+
+
 @pytest.fixture
 def temp_projects_dir():
     """Create a temporary projects directory with test sessions."""
@@ -30,27 +57,11 @@ def temp_projects_dir():
 
         # Session with searchable content
         session1 = project_dir / "session-auth-work.jsonl"
-        session1.write_text(
-            json.dumps({"type": "init", "cwd": "/test/myproject"})
-            + "\n"
-            + json.dumps({"role": "user", "content": "Help me fix the authentication bug"})
-            + "\n"
-            + json.dumps({"role": "assistant", "content": "I'll help you with that."})
-            + "\n"
-            + json.dumps({"role": "user", "content": "Also update the auth middleware"})
-            + "\n"
-        )
+        session1.write_bytes(_AUTH_SESSION)
 
         # Another session
         session2 = project_dir / "session-refactor.jsonl"
-        session2.write_text(
-            json.dumps({"type": "init", "cwd": "/test/another"})
-            + "\n"
-            + json.dumps({"role": "user", "content": "Refactor the database layer"})
-            + "\n"
-            + json.dumps({"role": "assistant", "content": "Sure, let me help."})
-            + "\n"
-        )
+        session2.write_bytes(_REFACTOR_SESSION)
 
         yield projects_dir
 
@@ -114,6 +125,29 @@ class TestAnalyticsCommand:
         assert isinstance(output_data["avg_messages_per_session"], (int, float))
         assert isinstance(output_data["projects"], dict)
 
+    def test_analytics_most_active_tie_goes_to_first_project(self, runner, monkeypatch):
+        """Test that a tie for most active project keeps the first project seen."""
+        from orchestra.core.session import Session
+
+        sessions = [
+            Session(
+                session_id=f"s{i}",
+                project_hash="hash",
+                project_path=f"/work/{name}",
+                session_path=Path(f"/work/s{i}.jsonl"),
+                modified_at=datetime.now(),
+                message_count=1,
+            )
+            for i, name in enumerate(["alpha", "beta", "beta", "alpha"])
+        ]
+        monkeypatch.setattr("orchestra.cli._find_recent", lambda *args, **kwargs: sessions)
+
+        result = runner.invoke(main, ["analytics", "--json"])
+
+        assert result.exit_code == 0
+        most_active = json.loads(result.output)["most_active_project"]
+        assert most_active == {"name": "alpha", "session_count": 2}
+
 
 # =============================================================================
 # Search Command Tests
@@ -169,6 +203,27 @@ class TestSearchCommand:
         assert first_result["match_count"] > 0
 
 
+# =============================================================================
+# Init Command Tests
+# =============================================================================
+
+
+class TestInitCommand:
+    """Tests for the init command."""
+
+    def test_init_appends_missing_gitignore_entries_once(self, runner, tmp_path, monkeypatch):
+        """Test that init adds each ignore entry once, on its own line."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".gitignore").write_text("node_modules/\n.orchestra/foo")
+
+        assert runner.invoke(main, ["init"]).exit_code == 0
+        assert runner.invoke(main, ["init", "--force"]).exit_code == 0
+
+        assert (tmp_path / ".gitignore").read_text() == (
+            "node_modules/\n.orchestra/foo\n.worktrees\n.orchestra/\n"
+        )
+
+
 # =============================================================================
 # Export Command Tests
 # =============================================================================
@@ -235,3 +290,37 @@ class TestExportCommand:
 
         assert result.exit_code == 1
         assert "Please provide a session ID or use --last" in result.output
+
+
+# =============================================================================
+# Formatting Helper Tests
+# =============================================================================
+
+
+class TestFormatBytes:
+    """Tests for the _format_bytes helper."""
+
+    def test_unit_boundaries(self):
+        """Test that each unit starts exactly at its power of 1024."""
+        from orchestra.cli import _format_bytes
+
+        assert _format_bytes(0) == "0 B"
+        assert _format_bytes(1023) == "1023 B"
+        assert _format_bytes(1024) == "1.0 KB"
+        assert _format_bytes(1024 * 1024 - 1) == "1024.0 KB"
+        assert _format_bytes(1024 * 1024) == "1.0 MB"
+        assert _format_bytes(1024 * 1024 * 1024) == "1.00 GB"
+        assert _format_bytes(3 * 1024**4) == "3072.00 GB"
+
+
+class TestTrunc:
+    """Tests for the _trunc helper."""
+
+    def test_truncation(self):
+        """Test that only over-long strings are cut and marked."""
+        from orchestra.cli import _trunc
+
+        assert _trunc(None, 5) == ""
+        assert _trunc("abcde", 5) == "abcde"
+        assert _trunc("abcdef", 5) == "abcd…"
+        assert len(_trunc("x" * 100, 40)) == 40
@@ -0,0 +1,39 @@
+"""Tests for configuration loading."""
+
+import json
+import os
+
+from orchestra.config import OrchestraConfig, _load_cached
+
+
+def test_load_reparses_only_when_file_changes(tmp_path):
+    """Test that repeated loads reuse the parse until the file is modified."""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"max_parallel": 4, "branch_prefix": "bot"}))
+    _load_cached.cache_clear()
+
+    assert OrchestraConfig.load(config_path).max_parallel == 4
+    assert OrchestraConfig.load(config_path).branch_prefix == "bot"
+    assert _load_cached.cache_info().hits == 1
+
+    config_path.write_text(json.dumps({"max_parallel": 6}))
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert OrchestraConfig.load(config_path).max_parallel == 6
+
+
+def test_loaded_configs_do_not_share_lists(tmp_path):
+    """Test that mutating one loaded config leaves later loads untouched."""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"bypass_permissions": ["Read(*)"]}))
+
+    first = OrchestraConfig.load(config_path)
+    first.bypass_permissions.append("Bash(*)")
+
+    assert OrchestraConfig.load(config_path).bypass_permissions == ["Read(*)"]
+
+
+def test_load_missing_file_uses_defaults(tmp_path):
+    """Test that a missing config file yields the defaults."""
+    assert OrchestraConfig.load(tmp_path / "missing.json") == OrchestraConfig()
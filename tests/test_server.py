@@ -0,0 +1,95 @@
+"""Tests for the dashboard server."""
+
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from orchestra.core.agent import Orchestrator
+from orchestra.core.session import SessionManager
+from orchestra.core.state import StateManager
+from orchestra.dashboard import server
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """Point the dashboard at an empty orchestrator and reset its caches."""
+    orchestrator = Orchestrator(
+        repo_path=tmp_path,
+        state_manager=StateManager(state_file=tmp_path / "state.json"),
+        session_manager=SessionManager(projects_dir=tmp_path / "projects"),
+    )
+    monkeypatch.setattr(server, "orchestrator", orchestrator)
+    monkeypatch.setattr(server, "_status_cache", None)
+    monkeypatch.setattr(server, "_last_broadcast", (0.0, None))
+    monkeypatch.setattr(server, "_status_message", (None, ""))
+    monkeypatch.setattr(server, "_response_cache", {})
+    return server.app
+
+
+def test_status_pushed_after_change_in_every_app_run(app):
+    # Each run gets its own event loop; push state must not stay bound to the first
+    for _ in range(2):
+        with TestClient(app) as client:
+            with client.websocket_connect("/ws/status") as websocket:
+                assert json.loads(websocket.receive_text())["total"] == 0
+
+                client.post("/api/agents/unknown/pause")
+
+                assert json.loads(websocket.receive_text())["total"] == 0
+
+
+class _StalledWebSocket:
+    """WebSocket stand-in whose sends never complete."""
+
+    def __init__(self):
+        self.closed = asyncio.Event()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message):
+        await asyncio.sleep(3600)
+
+    async def receive_text(self):
+        await self.closed.wait()
+
+
+def test_slow_client_dropped(app, monkeypatch):
+    monkeypatch.setattr(server, "SEND_TIMEOUT", 0.05)
+
+    async def run():
+        async with server.lifespan(app):
+            websocket = _StalledWebSocket()
+            await asyncio.wait_for(server.websocket_status(websocket), timeout=5)
+            return websocket in server.connections
+
+    assert asyncio.run(run()) is False
+
+
+def test_dashboard_gzipped_when_accepted(app):
+    client = TestClient(app)
+
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.text == server.DASHBOARD_HTML
+
+    response = client.get("/", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.text == server.DASHBOARD_HTML
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"tasks": ["task"] * (server.MAX_SPAWN_TASKS + 1)},
+        {"tasks": ["task"], "parallel": 0},
+    ],
+)
+def test_spawn_rejects_oversized_request(app, payload):
+    response = TestClient(app).post("/api/spawn", json=payload)
+
+    assert response.status_code == 422
+    assert server.orchestrator.state.list_agents() == []
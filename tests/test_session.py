@@ -1,6 +1,7 @@
 """Tests for session discovery."""
 
 import json
+import os
 import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -10,6 +11,20 @@ import pytest
 from orchestra.core.session import Session, SessionManager
 
 
+def _jsonl(*messages: dict) -> bytes:
+    """Encode messages as a session JSONL file body."""
+    return "".join(json.dumps(m) + "\n" for m in messages).encode()
+
+
+# Session file bodies, encoded once for every test that uses them
+_RECENT_SESSION = _jsonl(
+    {"type": "init", "cwd": "/test/project"},
+    {"role": "user", "content": "Hello"},
+    {"role": "assistant", "content": "Hi!"},
+)
+_OLD_SESSION = _jsonl({"type": "init", "cwd": "/test/old"})
+
+
 @pytest.fixture
 def temp_projects_dir():
     """Create a temporary projects directory with test sessions."""
@@ -23,18 +38,11 @@ def temp_projects_dir():
 
         # Recent session
         recent_session = project_dir / "session-recent.jsonl"
-        recent_session.write_text(
-            json.dumps({"type": "init", "cwd": "/test/project"})
-            + "\n"
-            + json.dumps({"role": "user", "content": "Hello"})
-            + "\n"
-            + json.dumps({"role": "assistant", "content": "Hi!"})
-            + "\n"
-        )
+        recent_session.write_bytes(_RECENT_SESSION)
 
         # Old session (modified to be old)
         old_session = project_dir / "session-old.jsonl"
-        old_session.write_text(json.dumps({"type": "init", "cwd": "/test/old"}) + "\n")
+        old_session.write_bytes(_OLD_SESSION)
         # Set modification time to 1 week ago
         old_time = datetime.now() - timedelta(days=7)
         import os
@@ -78,3 +86,326 @@ def test_session_metadata():
     assert session.session_id == "test-123"
     assert session.message_count == 5
     assert session.status == "unknown"
+
+
+def test_find_recent_parallel_matches_serial(temp_projects_dir):
+    """Test that threaded scanning returns the same sessions as serial."""
+    project_dir = temp_projects_dir / "def456"
+    project_dir.mkdir()
+    for i in range(10):
+        (project_dir / f"session-{i}.jsonl").write_text(
+            json.dumps({"type": "init", "cwd": f"/test/p{i}"})
+            + "\n"
+            + json.dumps({"role": "user", "content": f"Prompt {i}"})
+            + "\n"
+        )
+
+    serial = SessionManager(projects_dir=temp_projects_dir, workers=1).find_recent(hours=1)
+    parallel = SessionManager(projects_dir=temp_projects_dir, workers=4).find_recent(hours=1)
+
+    assert len(serial) == 11
+    assert [s.session_id for s in parallel] == [s.session_id for s in serial]
+    assert [s.last_prompt for s in parallel] == [s.last_prompt for s in serial]
+
+
+def test_search_case_sensitivity(temp_projects_dir):
+    """Test case-insensitive and case-sensitive prompt search."""
+    manager = SessionManager(projects_dir=temp_projects_dir)
+
+    assert [r["session_id"] for r in manager.search("HELLO", hours=1)] == ["session-recent"]
+    assert manager.search("HELLO", hours=1, case_sensitive=True) == []
+    assert len(manager.search("Hello", hours=1, case_sensitive=True)) == 1
+
+
+def test_search_matches_escaped_text(temp_projects_dir):
+    """Test queries whose characters are escaped in the raw JSONL."""
+    session_file = temp_projects_dir / "abc123" / "session-quoted.jsonl"
+    session_file.write_text(
+        json.dumps({"role": "user", "content": 'Rename "café" to "cafe"'}) + "\n"
+    )
+    manager = SessionManager(projects_dir=temp_projects_dir)
+
+    assert len(manager.search('"café"', hours=1)) == 1
+    assert manager.search("not there", hours=1) == []
+
+
+def test_search_line_prefilter_keeps_project_path(temp_projects_dir):
+    """Test that skipping non-matching lines still reads the init message."""
+    session_file = temp_projects_dir / "abc123" / "session-long.jsonl"
+    messages = [{"type": "init", "cwd": "/test/long"}]
+    messages += [{"role": "assistant", "content": f"Step {i}"} for i in range(50)]
+    messages += [{"role": "user", "content": "Deploy the Widget"}]
+    messages += [{"role": "assistant", "content": "widget deployed"}]
+    session_file.write_text("".join(json.dumps(m) + "\n" for m in messages))
+    manager = SessionManager(projects_dir=temp_projects_dir)
+
+    [result] = manager.search("widget", hours=1)
+    assert result["project_path"] == "/test/long"
+    assert result["matching_prompts"] == ["Deploy the Widget"]
+
+    # Queries without a raw-bytes prefilter still only decode init/user lines
+    session_file.write_text(
+        "".join(json.dumps(m) + "\n" for m in messages[:-2])
+        + json.dumps({"role": "user", "content": "Ship the café"})
+        + "\n"
+        + json.dumps({"role": "assistant", "content": "café shipped"})
+        + "\n"
+    )
+    [result] = manager.search("CAFÉ", hours=1)
+    assert result["project_path"] == "/test/long"
+    assert result["matching_prompts"] == ["Ship the café"]
+
+
+def test_search_streams_large_sessions(temp_projects_dir, monkeypatch):
+    """Test that sessions over the slurp limit are searched line by line."""
+    monkeypatch.setattr("orchestra.core.session._SLURP_LIMIT", 0)
+    (temp_projects_dir / "abc123" / "session-big.jsonl").write_bytes(
+        _jsonl(
+            {"type": "init", "cwd": "/test/big"},
+            {"role": "user", "content": "Fix the Login page"},
+            {"role": "assistant", "content": "login fixed"},
+        )
+    )
+    manager = SessionManager(projects_dir=temp_projects_dir)
+
+    [result] = manager.search("LOGIN", hours=1)
+    assert result["project_path"] == "/test/big"
+    assert result["matching_prompts"] == ["Fix the Login page"]
+    assert manager.search("LOGIN", hours=1, case_sensitive=True) == []
+
+
+@pytest.mark.parametrize("separators", [(",", ":"), (", ", ": ")])
+@pytest.mark.parametrize("tail", ["", '{"role":"user","content":"cut o'])
+@pytest.mark.parametrize(
+    "noise",
+    ["", "not json\n", " \n", '{"role":"assistant","content":"torn\n', "{not json}\n"],
+)
+def test_parse_session_fast_path_matches_full_parse(tmp_path, tail, separators, noise):
+    """Test that the newline/rfind scan agrees with decoding every line."""
+    messages = [
+        {"type": "init", "cwd": "/first"},
+        {"role": "user", "content": "Earlier prompt"},
+        {"type": "init", "cwd": "/second"},
+        {"role": "user", "content": [{"type": "text", "text": "Block prompt"}]},
+        {"role": "assistant", "message": {"role": "user", "content": "nested"}},
+        {"role": "user", "content": [{"type": "tool_result", "content": "ok"}]},
+        {"role": "assistant", "content": 'He said "role":"user"'},
+    ]
+    session_file = tmp_path / "compact.jsonl"
+    lines = [json.dumps(m, separators=separators) + "\n" for m in messages]
+    lines.insert(2, noise)  # skipped by the full parse, so never counted
+    session_file.write_text("".join(lines) + tail)
+
+    manager = SessionManager(projects_dir=tmp_path)
+    session = manager._parse_session(session_file, "proj", datetime.now())
+
+    assert (session.message_count, session.project_path, session.last_prompt) == (
+        manager._parse_session_lines(session_file)
+    )
+    assert session.message_count == len(messages)
+    assert session.project_path == "/second"
+    assert session.last_prompt == "Block prompt"
+
+
+def test_metadata_cache_reuses_unchanged_files(temp_projects_dir, tmp_path, monkeypatch):
+    """Test that cached metadata is used until a file's mtime or size changes."""
+    cache_path = tmp_path / "sessions.json"
+    SessionManager(projects_dir=temp_projects_dir, cache_path=cache_path).find_recent(hours=1)
+    assert cache_path.exists()
+
+    def fail_parse(*args):
+        raise AssertionError("unchanged session was re-parsed")
+
+    manager = SessionManager(projects_dir=temp_projects_dir, cache_path=cache_path)
+    monkeypatch.setattr(manager, "_parse_session", fail_parse)
+    sessions = manager.find_recent(hours=1)
+    assert sessions[0].message_count == 3
+    assert sessions[0].project_path == "/test/project"
+    assert sessions[0].last_prompt == "Hello"
+
+    session_file = temp_projects_dir / "abc123" / "session-recent.jsonl"
+    with open(session_file, "a") as f:
+        f.write(json.dumps({"role": "user", "content": "Follow-up"}) + "\n")
+
+    manager = SessionManager(projects_dir=temp_projects_dir, cache_path=cache_path)
+    sessions = manager.find_recent(hours=1)
+    assert sessions[0].message_count == 4
+    assert sessions[0].last_prompt == "Follow-up"
+
+
+def test_metadata_cache_drops_deleted_files(temp_projects_dir, tmp_path):
+    """Test that entries for removed session files are pruned on save."""
+    cache_path = tmp_path / "sessions.json"
+    SessionManager(projects_dir=temp_projects_dir, cache_path=cache_path).find_recent(hours=1)
+
+    (temp_projects_dir / "abc123" / "session-recent.jsonl").unlink()
+    SessionManager(projects_dir=temp_projects_dir, cache_path=cache_path).find_recent(hours=1)
+
+    assert json.loads(cache_path.read_text())["sessions"] == {}
+
+
+def test_get_session_by_id(temp_projects_dir):
+    """Test direct lookup of a session across project directories."""
+    manager = SessionManager(projects_dir=temp_projects_dir)
+
+    session = manager.get_session("session-old")
+    assert session.project_hash == "abc123"
+    assert session.project_path == "/test/old"
+    assert manager.get_session("does-not-exist") is None
+
+
+def test_get_session_uses_directory_seen_in_scan(temp_projects_dir, monkeypatch):
+    """Test that a prior scan lets get_session skip walking the projects."""
+    manager = SessionManager(projects_dir=temp_projects_dir)
+    manager.find_recent(hours=1)
+
+    def no_scandir(path):
+        raise AssertionError(f"unexpected scandir of {path}")
+
+    with monkeypatch.context() as m:
+        m.setattr("orchestra.core.session.os.scandir", no_scandir)
+        assert manager.get_session("session-old").project_path == "/test/old"
+
+    (temp_projects_dir / "abc123" / "session-old.jsonl").unlink()
+    assert manager.get_session("session-old") is None
+
+
+def test_export_and_load_messages_skip_metadata_parse(temp_projects_dir, tmp_path, monkeypatch):
+    """Test that export reads cached metadata and load_messages needs none."""
+    cache_path = tmp_path / "sessions.json"
+    SessionManager(projects_dir=temp_projects_dir, cache_path=cache_path).find_recent(hours=1)
+
+    def fail_parse(*args):
+        raise AssertionError("session metadata was re-parsed")
+
+    manager = SessionManager(projects_dir=temp_projects_dir, cache_path=cache_path)
+    monkeypatch.setattr(manager, "_parse_session", fail_parse)
+
+    markdown = manager.export_to_markdown("session-recent")
+    assert "- **Message Count:** 3" in markdown
+    assert "Hello" in markdown and "Hi!" in markdown
+    assert [m["role"] for m in manager.load_messages("session-old")] == []
+    assert [m["role"] for m in manager.load_messages("session-recent")] == ["user", "assistant"]
+
+
+def test_export_formats_tool_blocks(tmp_path):
+    """Test that tool input and results are exported as readable JSON."""
+    project_dir = tmp_path / "proj"
+    project_dir.mkdir()
+    content = [
+        {"type": "text", "text": "Running it"},
+        {"type": "tool_use", "name": "Write", "input": {"path": "café.txt"}},
+        {"type": "tool_result", "content": [{"ok": True}]},
+    ]
+    (project_dir / "s1.jsonl").write_text(
+        json.dumps({"role": "assistant", "content": content}) + "\n"
+    )
+
+    markdown = SessionManager(projects_dir=tmp_path).export_to_markdown("s1")
+
+    expected = (
+        'Running it\n**Tool: Write**\n```json\n{\n  "path": "café.txt"\n}\n```\n'
+        '**Tool Result:**\n```\n[\n  {\n    "ok": true\n  }\n]\n```\n'
+    )
+    assert expected in markdown
+
+
+def test_export_to_markdown_document(tmp_path):
+    """Test the full markdown document, which ends right after the last message."""
+    project_dir = tmp_path / "proj"
+    project_dir.mkdir()
+    session_file = project_dir / "s1.jsonl"
+    session_file.write_bytes(
+        _jsonl(
+            {"type": "init", "cwd": "/test/md"},
+            {"role": "user", "content": "Hi"},
+            {"role": "assistant", "content": "Yo"},
+        )
+    )
+    modified = datetime(2024, 5, 1, 12, 30, 0)
+    os.utime(session_file, (modified.timestamp(), modified.timestamp()))
+
+    markdown = SessionManager(projects_dir=tmp_path).export_to_markdown("s1")
+
+    assert markdown == (
+        "# Session Export: s1\n\n"
+        "## Metadata\n\n"
+        "- **Session ID:** `s1`\n"
+        "- **Project:** `/test/md`\n"
+        "- **Modified:** 2024-05-01 12:30:00\n"
+        "- **Message Count:** 3\n\n"
+        "---\n\n"
+        "## Conversation\n\n"
+        "### User\n\n"
+        "Hi\n\n"
+        "### Assistant\n\n"
+        "Yo\n"
+    )
+
+
+def test_get_most_recent_parses_only_newest(temp_projects_dir, monkeypatch):
+    """Test that finding the latest session reads just that one file."""
+    manager = SessionManager(projects_dir=temp_projects_dir)
+    parsed = []
+    real_parse = manager._parse_session
+
+    def spy_parse(path, *args):
+        parsed.append(path)
+        return real_parse(path, *args)
+
+    monkeypatch.setattr(manager, "_parse_session", spy_parse)
+
+    session = manager.get_most_recent()
+
+    assert session.session_id == "session-recent"
+    assert [p.stem for p in parsed] == ["session-recent"]
+
+
+def test_check_health_flags_orphaned_projects(temp_projects_dir, tmp_path):
+    """Test that sessions whose project directory is gone are orphaned."""
+    live = tmp_path / "live"
+    live.mkdir()
+    project_dir = temp_projects_dir / "abc123"
+    cwds = [
+        ("s-live", live),
+        ("s-gone", tmp_path / "gone"),
+        ("s-far", "/no/such"),
+        # Never in a directory listing, but they exist
+        ("s-dot", f"{live}/."),
+        ("s-dotdot", f"{live}/.."),
+    ]
+    for name, cwd in cwds:
+        (project_dir / f"{name}.jsonl").write_text(
+            json.dumps({"type": "init", "cwd": str(cwd)}) + "\n"
+        )
+
+    manager = SessionManager(projects_dir=temp_projects_dir)
+    report = manager.check_health(hours=1)
+
+    orphaned = {s["session_id"] for s in report["orphaned_sessions"]}
+    assert orphaned == {"s-gone", "s-far", "session-recent"}
+
+
+def test_check_health_buckets_and_rankings(tmp_path):
+    """Test stale counts and the top-10 largest/oldest rankings."""
+    import os
+
+    project_dir = tmp_path / "proj"
+    project_dir.mkdir()
+    now = datetime.now().timestamp()
+    for i in range(12):
+        path = project_dir / f"s{i:02d}.jsonl"
+        path.write_text('{"role":"user","content":"x"}\n' * (1001 + i))
+        age = (i + 1) * 3600 * (50 if i % 2 else 1)  # odd sessions are >48h old
+        os.utime(path, (now - age, now - age))
+
+    report = SessionManager(projects_dir=tmp_path).check_health(hours=10_000)
+
+    assert report["session_count"] == 12
+    assert report["active_sessions"] == 6
+    assert [s["session_id"] for s in report["stale_sessions"]][:2] == ["s11", "s09"]
+    assert [s["session_id"] for s in report["largest_sessions"]] == [
+        f"s{i:02d}" for i in range(11, 1, -1)
+    ]
+    assert [s["session_id"] for s in report["oldest_sessions"]][:3] == ["s11", "s09", "s07"]
+    assert len(report["oldest_sessions"]) == 10
@@ -0,0 +1,161 @@
+"""Tests for state persistence."""
+
+import json
+from datetime import datetime, timedelta
+
+from orchestra.core.state import AgentState, StateManager
+
+
+def _agent(agent_id: str) -> AgentState:
+    return AgentState(
+        agent_id=agent_id,
+        session_id=None,
+        worktree_path=None,
+        task=f"task {agent_id}",
+        status="running",
+        started_at=datetime.now(),
+    )
+
+
+def test_reload_if_changed_picks_up_other_writers(tmp_path):
+    """Test that a reader sees agents saved by another StateManager."""
+    state_file = tmp_path / "state.json"
+    writer = StateManager(state_file=state_file)
+    reader = StateManager(state_file=state_file)
+
+    writer.add_agent(_agent("a1"))
+    assert [a.agent_id for a in reader.list_agents()] == ["a1"]
+    assert not reader.reload_if_changed()
+
+    writer.add_agent(_agent("a2"))
+
+    assert reader.reload_if_changed()
+    assert sorted(a.agent_id for a in reader.list_agents()) == ["a1", "a2"]
+
+
+def test_appends_do_not_hide_other_writers(tmp_path, monkeypatch):
+    """Test that a manager's own append does not mask another's, nor compact it away."""
+    state_file = tmp_path / "state.json"
+    first = StateManager(state_file=state_file)
+    second = StateManager(state_file=state_file)
+    first.list_agents()
+    second.list_agents()
+
+    first.add_agent(_agent("a1"))
+    second.add_agent(_agent("a2"))
+
+    assert second.reload_if_changed()
+    assert sorted(a.agent_id for a in second.list_agents()) == ["a1", "a2"]
+
+    monkeypatch.setattr("orchestra.core.state._WAL_COMPACT_BYTES", 0)
+    first.add_agent(_agent("a3"))
+    second.add_agent(_agent("a4"))
+
+    compacted = StateManager(state_file=state_file)
+    assert sorted(a.agent_id for a in compacted.list_agents()) == ["a1", "a2", "a3", "a4"]
+
+
+def test_own_saves_do_not_trigger_reload(tmp_path):
+    """Test that a manager's own writes are not mistaken for external ones."""
+    manager = StateManager(state_file=tmp_path / "state.json")
+    manager.add_agent(_agent("a1"))
+    manager.update_heartbeat("a1", "editing")
+
+    assert not manager.reload_if_changed()
+
+
+def test_mark_stale_agents_only_touches_old_running_agents(tmp_path):
+    """Test that staleness uses the heartbeat cutoff and ignores other statuses."""
+    manager = StateManager(state_file=tmp_path / "state.json")
+    old = datetime.now() - timedelta(seconds=600)
+    for agent_id, status, heartbeat in [
+        ("fresh", "running", datetime.now()),
+        ("old", "running", old),
+        ("done", "completed", old),
+        ("silent", "running", None),
+    ]:
+        agent = _agent(agent_id)
+        agent.status = status
+        agent.last_heartbeat = heartbeat
+        manager.state.agents[agent_id] = agent
+
+    assert manager.mark_stale_agents(threshold_seconds=300) == ["old"]
+    assert [a.agent_id for a in manager.list_agents(status="stale")] == ["old"]
+    assert manager.get_agent("done").status == "completed"
+
+
+def test_mutations_append_to_log_until_save(tmp_path):
+    """Test that small updates go to the log and replay on load."""
+    state_file = tmp_path / "state.json"
+    manager = StateManager(state_file=state_file)
+    manager.add_agent(_agent("a1"))
+    manager.add_agent(_agent("a2"))
+    manager.update_heartbeat("a1", "editing")
+    manager.remove_agent("a2")
+
+    assert not state_file.exists()
+    assert len(manager.wal_path.read_text().splitlines()) == 4
+
+    reloaded = StateManager(state_file=state_file)
+    agent = reloaded.get_agent("a1")
+    assert [a.agent_id for a in reloaded.list_agents()] == ["a1"]
+    assert agent.current_activity == "editing"
+    assert agent.last_heartbeat == manager.get_agent("a1").last_heartbeat
+
+    manager.save()
+    assert manager.wal_path.read_text() == ""
+    assert StateManager(state_file=state_file).get_agent("a1").current_activity == "editing"
+
+
+def test_log_writes_reuse_one_descriptor(tmp_path, monkeypatch):
+    """Test that heartbeats append through the open log descriptor."""
+    manager = StateManager(state_file=tmp_path / "state.json")
+    manager.add_agent(_agent("a1"))
+    fd = manager._wal_fd
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("log was reopened")
+
+    monkeypatch.setattr("orchestra.core.state.os.open", fail_open)
+    for i in range(3):
+        manager.update_heartbeat("a1", f"step {i}")
+
+    assert manager._wal_fd == fd
+    assert len(manager.wal_path.read_bytes().splitlines()) == 4
+    assert not manager.reload_if_changed()
+
+
+def test_log_compacts_when_large(tmp_path, monkeypatch):
+    """Test that an oversized log is folded into the snapshot."""
+    monkeypatch.setattr("orchestra.core.state._WAL_COMPACT_BYTES", 1024)
+    state_file = tmp_path / "state.json"
+    manager = StateManager(state_file=state_file)
+    manager.add_agent(_agent("a1"))
+    for i in range(20):
+        manager.update_heartbeat("a1", f"step {i}")
+
+    assert state_file.exists()
+    assert manager.wal_path.stat().st_size < 1024
+    assert StateManager(state_file=state_file).get_agent("a1").current_activity == "step 19"
+
+
+def test_load_skips_torn_log_line(tmp_path):
+    """Test that a partially written trailing record is ignored."""
+    state_file = tmp_path / "state.json"
+    manager = StateManager(state_file=state_file)
+    manager.add_agent(_agent("a1"))
+    with open(manager.wal_path, "a") as f:
+        f.write('{"op":"remove","id":')
+
+    assert [a.agent_id for a in StateManager(state_file=state_file).list_agents()] == ["a1"]
+
+
+def test_snapshot_matches_to_dict(tmp_path):
+    """Test that the saved snapshot is the to_dict document."""
+    state_file = tmp_path / "state.json"
+    manager = StateManager(state_file=state_file)
+    manager.add_agent(_agent("a1"))
+    manager.update_heartbeat("a1", "editing")
+    manager.save()
+
+    assert json.loads(state_file.read_text()) == manager.state.to_dict()
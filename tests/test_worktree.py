@@ -1,43 +1,46 @@
 """Tests for worktree management."""
 
+import shutil
 import subprocess
-import tempfile
-from pathlib import Path
+import time
+from datetime import datetime
 
 import pytest
 
 from orchestra.core.worktree import WorktreeManager
 
 
+def _git(cwd, *args):
+    """Run a git command whose output the test does not need."""
+    subprocess.run(
+        ["git", *args], cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True
+    )
+
+
+@pytest.fixture(scope="session")
+def _base_repo(tmp_path_factory):
+    """Create a git repository with an initial commit once per test session."""
+    repo = tmp_path_factory.mktemp("base_repo")
+
+    # Initialize git repo
+    _git(repo, "init")
+    _git(repo, "config", "user.email", "test@test.com")
+    _git(repo, "config", "user.name", "Test")
+
+    # Create initial commit
+    (repo / "README.md").write_text("# Test")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-m", "Initial")
+
+    return repo
+
+
 @pytest.fixture
-def git_repo():
-    """Create a temporary git repository."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        repo = Path(tmpdir)
-
-        # Initialize git repo
-        subprocess.run(["git", "init"], cwd=repo, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=repo,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=repo,
-            capture_output=True,
-        )
-
-        # Create initial commit
-        (repo / "README.md").write_text("# Test")
-        subprocess.run(["git", "add", "."], cwd=repo, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Initial"],
-            cwd=repo,
-            capture_output=True,
-        )
-
-        yield repo
+def git_repo(_base_repo, tmp_path):
+    """Create a temporary git repository by copying the session's base repo."""
+    repo = tmp_path / "repo"
+    shutil.copytree(_base_repo, repo)
+    return repo
 
 
 def test_create_worktree(git_repo):
@@ -75,6 +78,7 @@ def test_get_worktree(git_repo):
     worktree = manager.get_worktree("my-task")
     assert worktree is not None
     assert worktree.task == "my-task"
+    assert manager.get_worktree("My Task") == worktree
 
     # Non-existent worktree
     assert manager.get_worktree("nonexistent") is None
@@ -89,3 +93,154 @@ def test_remove_worktree(git_repo):
 
     manager.remove(worktree)
     assert not worktree.path.exists()
+
+
+def test_create_worktree_from_base_branch(git_repo):
+    """Test that new worktrees start from HEAD or the given base branch."""
+    _git(git_repo, "branch", "base")
+    (git_repo / "later.txt").write_text("later")
+    _git(git_repo, "add", ".")
+    _git(git_repo, "commit", "-m", "Later")
+
+    manager = WorktreeManager(repo_path=git_repo)
+    from_head = manager.create("from-head")
+    from_base = manager.create("from-base", base_branch="base")
+
+    assert (from_head.path / "later.txt").exists()
+    assert not (from_base.path / "later.txt").exists()
+
+
+def _commit(path, name):
+    (path / name).write_text(name)
+    _git(path, "add", ".")
+    _git(path, "commit", "-m", name)
+
+
+def test_cleanup_removes_only_merged_worktrees(git_repo):
+    """Test that cleanup removes merged work and keeps everything else."""
+    _git(git_repo, "branch", "-M", "main")
+    manager = WorktreeManager(repo_path=git_repo)
+    merged = manager.create("merged")
+    unmerged = manager.create("unmerged")
+    fresh = manager.create("fresh")
+    dirty = manager.create("dirty")
+    for worktree in (merged, unmerged, dirty):
+        _commit(worktree.path, f"{worktree.task}.txt")
+    for worktree in (merged, dirty):
+        _git(git_repo, "merge", worktree.branch)
+    (dirty.path / "scratch.txt").write_text("uncommitted")
+
+    assert manager.cleanup() == 1
+    assert not merged.path.exists()
+    assert fresh.path.exists()
+    assert sorted(wt.task for wt in manager.list_active()) == ["dirty", "fresh", "unmerged"]
+
+
+def test_cleanup_deletes_branches_merged_into_main_from_another_checkout(git_repo):
+    """Test that cleanup judges branches against main, not the main checkout's HEAD."""
+    _git(git_repo, "branch", "-M", "main")
+    manager = WorktreeManager(repo_path=git_repo)
+    worktree = manager.create("fix-it")
+    _commit(worktree.path, "fix.txt")
+    _git(git_repo, "merge", worktree.branch)
+    _git(git_repo, "checkout", "-b", "elsewhere", "HEAD~1")
+
+    assert manager.cleanup() == 1
+    assert not worktree.path.exists()
+    branches = subprocess.run(
+        ["git", "branch", "--list", worktree.branch], cwd=git_repo, capture_output=True, text=True
+    )
+    assert branches.stdout == ""
+
+
+def test_list_active_reuses_recent_result(git_repo, monkeypatch):
+    """Test that repeated listings share one git call until a change."""
+    manager = WorktreeManager(repo_path=git_repo)
+    manager.create("first")
+
+    calls = []
+    real_list = manager._list_worktrees
+    monkeypatch.setattr(manager, "_list_worktrees", lambda: calls.append(1) or real_list())
+
+    assert manager.get_worktree("first") is not None
+    assert len(manager.list_active()) == 1
+    assert len(calls) == 1
+
+    manager.create("second")
+    assert len(manager.list_active()) == 2
+    assert len(calls) == 2
+
+
+def test_cleanup_all_removes_worktrees_and_branches(git_repo):
+    """Test that cleanup without merged_only removes every worktree and branch."""
+    manager = WorktreeManager(repo_path=git_repo)
+    worktrees = [manager.create(f"bulk-{i}") for i in range(5)]
+
+    assert manager.cleanup(merged_only=False) == 5
+    assert not any(wt.path.exists() for wt in worktrees)
+    assert manager.list_active() == []
+    branches = subprocess.run(
+        ["git", "branch", "--list", "orchestra/*"], cwd=git_repo, capture_output=True, text=True
+    )
+    assert branches.stdout == ""
+
+
+def test_list_active_reports_directory_creation_time(git_repo):
+    """Test that created_at comes from the worktree directory, not the listing."""
+    manager = WorktreeManager(repo_path=git_repo)
+    manager.create("timed")
+    created_by = datetime.now()
+    time.sleep(0.02)
+
+    [worktree] = WorktreeManager(repo_path=git_repo).list_active()
+    assert worktree.created_at <= created_by
+
+
+def test_create_reuses_existing_branch_and_reports_failures(git_repo):
+    """Test that an existing branch is checked out and git errors surface."""
+    _git(git_repo, "branch", "orchestra/existing")
+    manager = WorktreeManager(repo_path=git_repo)
+
+    worktree = manager.create("existing")
+    assert worktree.path.exists()
+    assert manager.get_worktree("existing").branch == "orchestra/existing"
+
+    with pytest.raises(RuntimeError, match="orchestra/existing"):
+        manager.create("existing")
+
+
+def test_get_worktree_reads_predictable_path_without_git(git_repo, monkeypatch):
+    """Test that get_worktree confirms create()'s layout without listing."""
+    WorktreeManager(repo_path=git_repo).create("direct")
+    (git_repo / ".worktrees" / "task-impostor").mkdir()
+
+    manager = WorktreeManager(repo_path=git_repo)
+    calls = []
+    real_list = manager._list_worktrees
+    monkeypatch.setattr(manager, "_list_worktrees", lambda: calls.append(1) or real_list())
+
+    worktree = manager.get_worktree("direct")
+    assert worktree.branch == "orchestra/direct"
+    assert worktree.path == git_repo / ".worktrees" / "task-direct"
+    assert calls == []
+
+    assert manager.get_worktree("impostor") is None
+    assert calls == [1]
+
+
+def test_remove_keeps_dirty_worktree_unless_forced(git_repo):
+    """Test that remove() only discards changes when forced."""
+    manager = WorktreeManager(repo_path=git_repo)
+    worktree = manager.create("careful")
+    _commit(worktree.path, "work.txt")
+    (worktree.path / "scratch.txt").write_text("uncommitted")
+
+    assert manager.remove(worktree) is False
+    assert worktree.path.exists()
+
+    assert manager.remove(worktree, force=True) is True
+    assert not worktree.path.exists()
+    branches = subprocess.run(
+        ["git", "branch", "--list", worktree.branch], cwd=git_repo, capture_output=True, text=True
+    )
+    assert branches.stdout == ""